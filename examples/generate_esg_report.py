@@ -8,24 +8,49 @@ Este script demonstra a geração de relatórios ESG com:
 - Tratamento de erros
 """
 
+import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import markdown
 
-from docsync.core import DocumentSynchronizer
+from docsync import get_synchronizer
 from docsync.exceptions import DocSyncError
 
-# Inicializa console rich para feedback visual
-console = Console()
+logger = logging.getLogger(__name__)
 
+# Caminhos do projeto
+BASE_PATH = Path(__file__).resolve().parent.parent
+TEMPLATES_PATH = BASE_PATH / "src" / "docsync" / "templates"
+OUTPUT_DIR = os.path.join(BASE_PATH, "reports")
 
-def generate_esg_data():
-    """Gera dados de exemplo para o relatório ESG."""
-    return {
+
+def _freeze(value):
+    """Converte dicionários e listas aninhados em visões somente leitura."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Desfaz ``_freeze``, devolvendo dicionários e listas independentes."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Dados de exemplo do relatório ESG, montados uma única vez no carregamento e
+# congelados em todos os níveis
+_ESG_SAMPLE = _freeze(
+    {
         "metrics": [
             {
                 "category": "ambiental",
@@ -102,69 +127,173 @@ def generate_esg_data():
                 "timeline": "Q3 2024",
             },
         ],
-    }
+    },
+)
+
+# Cabeçalho fixo do relatório gerado em main()
+_REPORT_HEADER = MappingProxyType(
+    {
+        "title": "Relatório ESG GUARDRIVE Q1 2024",
+        "period": "Q1 2024",
+        "overview": "Relatório trimestral de métricas ESG.",
+        "version": "1.0.0",
+    },
+)
+
+
+def generate_esg_data(mutable: bool = False):
+    """Retorna os dados de exemplo para o relatório ESG.
+
+    Args:
+        mutable: Retorna uma cópia independente que pode ser alterada
+
+    Returns:
+        Mapping: Dados do relatório; por padrão somente leitura em todos os
+        níveis, com tuplas no lugar de listas
+    """
+    if mutable:
+        return _thaw(_ESG_SAMPLE)
+    return _ESG_SAMPLE
+
+
+class PlainConsole:
+    """Saída simples em stdout, usada no lugar do console Rich fora de TTY."""
+
+    def print(self, *objects, style=None) -> None:
+        print(*objects)
+
+
+_console = None
+
+
+def get_console():
+    """Retorna o console do exemplo, criado na primeira chamada.
+
+    O Rich só é importado quando a saída é um terminal interativo.
+    """
+    global _console
+    if _console is None:
+        if sys.stdout.isatty():
+            from rich.console import Console
+
+            _console = Console()
+        else:
+            _console = PlainConsole()
+    return _console
+
+
+class ProgressShim:
+    """Substituto do ``Progress`` que apenas registra as etapas em log.
+
+    Usado fora de terminais interativos (CI, saída redirecionada), onde a
+    atualização ao vivo do Rich não tem utilidade.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: list[list] = []
+
+    def __enter__(self) -> "ProgressShim":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def add_task(self, description: str, total=None) -> int:
+        self._tasks.append([description, 0, total])
+        logger.info("Iniciado: %s", description)
+        return len(self._tasks) - 1
+
+    def update(self, task_id: int, description=None, **kwargs) -> None:
+        if description is not None:
+            self._tasks[task_id][0] = description
+            logger.info("Etapa: %s", description)
+
+    def advance(self, task_id: int, advance: float = 1) -> None:
+        task = self._tasks[task_id]
+        task[1] += advance
+        if task[2] is not None and task[1] >= task[2]:
+            logger.info("Concluído: %s", task[0])
+
+
+def create_progress():
+    """Cria o indicador de progresso adequado ao terminal atual.
+
+    O Rich só é usado em TTY; ``DOCSYNC_PROGRESS=0`` desativa mesmo assim.
+    """
+    if sys.stdout.isatty() and os.environ.get("DOCSYNC_PROGRESS", "1") != "0":
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=get_console(),
+        )
+    return ProgressShim()
+
+
+def write_output(path: str, content: str) -> str:
+    """Grava um arquivo de saída do relatório e retorna seu caminho."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def write_html(path: str, md_text: str) -> str:
+    """Converte o Markdown renderizado em HTML e grava o arquivo."""
+    return write_output(path, markdown.markdown(md_text, extensions=["tables"]))
 
 
 def main():
     """Função principal do exemplo."""
+    console = get_console()
     try:
-        # Configura caminhos
-        base_path = Path(__file__).parent.parent
-        templates_path = base_path / "src" / "docsync" / "templates"
-        output_path = base_path / "reports"
-        output_path.mkdir(exist_ok=True)
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
 
         # Apresenta cabeçalho
-        console.print(
-            Panel.fit("🌿 Gerador de Relatório ESG - GUARDRIVE", style="green"),
-        )
+        title = "🌿 Gerador de Relatório ESG - GUARDRIVE"
+        if isinstance(console, PlainConsole):
+            console.print(title)
+        else:
+            from rich.panel import Panel
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            # Inicializa DocumentSynchronizer
-            task = progress.add_task(
-                "Inicializando Document Synchronizer...",
-                total=None,
-            )
-            doc_sync = DocumentSynchronizer(
-                base_path=base_path,
-                templates_path=templates_path,
-            )
-            progress.update(task, completed=True)
+            console.print(Panel.fit(title, style="green"))
+
+        with create_progress() as progress:
+            task = progress.add_task("Inicializando Document Synchronizer...", total=3)
+            doc_sync = get_synchronizer(str(BASE_PATH), str(TEMPLATES_PATH))
+            progress.advance(task)
 
             # Prepara dados
-            task = progress.add_task("Preparando dados do relatório...", total=None)
+            progress.update(task, description="Preparando dados do relatório...")
             report_data = generate_esg_data()
-            progress.update(task, completed=True)
+            progress.advance(task)
 
             # Gera relatório
-            task = progress.add_task("Gerando relatório ESG...", total=None)
+            progress.update(task, description="Gerando relatório ESG...")
             report_config = {
-                "title": "Relatório ESG GUARDRIVE Q1 2024",
-                "period": "Q1 2024",
-                "metrics": report_data["metrics"],
-                "objectives": report_data["objectives"],
-                "analysis": report_data["analysis"],
-                "recommendations": report_data["recommendations"],
-                "overview": "Relatório trimestral de métricas ESG.",
-                "version": "1.0.0",
-                "generated_at": datetime.now().strftime("%d/%m/%Y %H:%M"),
+                **_REPORT_HEADER,
+                **report_data,
+                "generated_at": format(datetime.now(), "%d/%m/%Y %H:%M"),
             }
 
-            output_file = output_path / "esg_q1_2024.md"
-            doc_sync.generate_report(
-                template_name="guardrive/esg_report",
-                output_path=output_file,
-                data=report_config,
-            )
-            progress.update(task, completed=True)
+            # Renderiza o Markdown uma única vez e converte o texto para HTML
+            md_text = doc_sync.render("guardrive/esg_report", report_config)
+            md_file = os.path.join(OUTPUT_DIR, "esg_q1_2024.md")
+            html_file = os.path.join(OUTPUT_DIR, "esg_q1_2024.html")
+
+            # Grava o Markdown enquanto o HTML é convertido em paralelo
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(write_output, md_file, md_text),
+                    executor.submit(write_html, html_file, md_text),
+                ]
+                output_files = [future.result() for future in futures]
+            progress.advance(task)
 
         # Apresenta resumo
         console.print("\n✨ Relatório gerado com sucesso!", style="green")
-        console.print(f"\n📝 Arquivo gerado: {output_file}", style="blue")
+        for output_file in output_files:
+            console.print(f"\n📝 Arquivo gerado: {output_file}", style="blue")
 
     except DocSyncError as e:
         console.print(f"\n❌ Erro ao gerar relatório: {e!s}", style="red")
@@ -8,8 +8,12 @@ Este módulo implementa a estrutura central do DOCSYNC, integrando:
 """
 
 import asyncio
-import logging.config
+import atexit
+import fnmatch
+import logging.handlers
 import os
+import queue
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -18,39 +22,110 @@ import yaml
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
-# Configuração de logging estruturado
-logging.config.dictConfig(
-    {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "structured": {
-                "()": structlog.stdlib.ProcessorFormatter,
-                "processor": structlog.processors.JSONRenderer(),
-            },
-        },
-        "handlers": {
-            "console": {
-                "level": "INFO",
-                "class": "logging.StreamHandler",
-                "formatter": "structured",
-            },
-            "file": {
-                "level": "DEBUG",
-                "class": "logging.FileHandler",
-                "filename": "docsync.log",
-                "formatter": "structured",
-            },
-        },
-        "loggers": {
-            "": {
-                "handlers": ["console", "file"],
-                "level": "INFO",
-            },
-        },
-    },
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML compilado sem libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson é opcional
+    orjson = None
+
+
+def _orjson_dumps(value: object, **kwargs: object) -> str:
+    """Serializa eventos com orjson mantendo a interface de ``json.dumps``."""
+    return orjson.dumps(value, default=kwargs.get("default")).decode()
+
+
+_json_renderer = (
+    structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+    if orjson is not None
+    else structlog.processors.JSONRenderer()
 )
 
+_logging_installed = False
+
+
+class _EventQueueHandler(logging.handlers.QueueHandler):
+    """``QueueHandler`` que entrega o evento do structlog intacto ao listener.
+
+    O ``prepare`` padrão formata a mensagem antes de enfileirar, convertendo
+    o dicionário do evento em texto e impedindo o ``ProcessorFormatter`` de
+    renderizá-lo lá no listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _install_logging() -> None:
+    """Configura o logging estruturado uma única vez por processo.
+
+    Executado na criação do ``DocSyncSetup`` e não na importação, para que
+    importar o módulo não abra ``docsync.log``. Os eventos do structlog viram
+    registros do ``logging`` e são entregues a uma ``QueueHandler``; a
+    renderização e a escrita no console e em arquivo acontecem na thread do
+    ``QueueListener``, fora do loop de eventos. O nível é definido no logger
+    raiz, e eventos abaixo dele são descartados antes de qualquer formatação.
+    """
+    global _logging_installed
+    if _logging_installed:
+        return
+
+    timestamper = structlog.processors.TimeStamper(fmt="iso")
+    formatter = structlog.stdlib.ProcessorFormatter(
+        # O orjson só vê o evento final: sem os metadados do formatter e com
+        # a exceção já convertida em texto
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            _json_renderer,
+        ],
+        # Registros de outras bibliotecas recebem os mesmos campos
+        foreign_pre_chain=[structlog.stdlib.add_log_level, timestamper],
+    )
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    file_handler = logging.FileHandler("docsync.log")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True,
+    )
+
+    root = logging.getLogger()
+    root.addHandler(_EventQueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    listener.start()
+    atexit.register(listener.stop)
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_log_level,
+            timestamper,
+            # O traceback precisa ser lido na thread que registrou o evento;
+            # no listener ``sys.exc_info()`` já está vazio
+            structlog.processors.format_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    _logging_installed = True
+
+
 logger = structlog.get_logger()
 
 
@@ -75,6 +150,8 @@ class DocSyncSetup:
         self.base_path = Path(os.getcwd())
         self.directories: dict[str, DirConfig] = {}
         self.observer = Observer()
+
+        _install_logging()
         self.logger = logger.bind(component="DocSyncSetup")
 
         # Carregar configuração inicial
@@ -84,7 +161,7 @@ class DocSyncSetup:
         """Carrega configuração do arquivo YAML."""
         try:
             with open(self.config_path) as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
 
             for dir_config in config.get("directories", []):
                 path = Path(dir_config["path"])
@@ -107,28 +184,35 @@ class DocSyncSetup:
 
     async def setup_directory_structure(self) -> None:
         """Cria e valida a estrutura de diretórios."""
-        for dir_config in self.directories.values():
-            dir_config.path.mkdir(parents=True, exist_ok=True)
+        await asyncio.gather(
+            *(self._setup_directory(d) for d in self.directories.values()),
+        )
 
-            # Validação quântica da estrutura
-            if dir_config.quantum_validation:
-                await self._validate_quantum_state(dir_config)
+    async def _setup_directory(self, dir_config: DirConfig) -> None:
+        """Cria e valida um diretório monitorado."""
+        await asyncio.to_thread(dir_config.path.mkdir, parents=True, exist_ok=True)
 
-            # Sincronização com consciência
-            if dir_config.consciousness_sync:
-                await self._sync_consciousness(dir_config)
+        # Validação quântica da estrutura
+        if dir_config.quantum_validation:
+            self._validate_quantum_state(dir_config)
 
-            self.logger.info(
-                "diretório_configurado",
-                path=str(dir_config.path),
-                patterns=dir_config.patterns,
-            )
+        # Sincronização com consciência
+        if dir_config.consciousness_sync:
+            self._sync_consciousness(dir_config)
 
-    async def _validate_quantum_state(self, dir_config: DirConfig) -> None:
+        self.logger.info(
+            "diretório_configurado",
+            path=str(dir_config.path),
+            patterns=dir_config.patterns,
+            quantum_validation=dir_config.quantum_validation,
+            consciousness_sync=dir_config.consciousness_sync,
+        )
+
+    def _validate_quantum_state(self, dir_config: DirConfig) -> None:
         """Validação quântica do estado do diretório."""
         try:
             # Implementar validação quântica aqui
-            self.logger.info("validação_quântica_ok", path=str(dir_config.path))
+            self.logger.debug("validação_quântica_ok", path=str(dir_config.path))
         except Exception as e:
             self.logger.exception(
                 "erro_validação_quântica",
@@ -136,11 +220,11 @@ class DocSyncSetup:
                 error=str(e),
             )
 
-    async def _sync_consciousness(self, dir_config: DirConfig) -> None:
+    def _sync_consciousness(self, dir_config: DirConfig) -> None:
         """Sincroniza estado com sistema de consciência."""
         try:
             # Implementar sincronização com consciência
-            self.logger.info("consciência_sincronizada", path=str(dir_config.path))
+            self.logger.debug("consciência_sincronizada", path=str(dir_config.path))
         except Exception as e:
             self.logger.exception(
                 "erro_sync_consciência",
@@ -174,18 +258,35 @@ class DocSyncSetup:
                 )
 
 
+def _compile_patterns(patterns: list[str]) -> re.Pattern:
+    """Une padrões glob em uma única expressão regular."""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
 class DocSyncEventHandler(FileSystemEventHandler):
     """Handler para eventos do sistema de arquivos."""
 
     def __init__(self, dir_config: DirConfig) -> None:
         self.dir_config = dir_config
-        self.logger = logger.bind(component="DocSyncEventHandler")
+        # Campos constantes do handler são vinculados uma única vez
+        self.logger = logger.bind(
+            component="DocSyncEventHandler",
+            directory=str(dir_config.path),
+        )
+        self._pattern_re = _compile_patterns(dir_config.patterns)
+
+    def _check_file_patterns(self, file_path: Path) -> bool:
+        """Verifica se o arquivo corresponde aos padrões do diretório."""
+        return self._pattern_re.match(file_path.name) is not None
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Processa qualquer evento do sistema de arquivos."""
         if event.is_directory:
             return
 
+        if not self._check_file_patterns(Path(event.src_path)):
+            return
+
         self.logger.info(
             "evento_detectado",
             event_type=event.event_type,
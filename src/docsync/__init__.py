@@ -7,24 +7,63 @@ This package provides tools for:
 - Notion integration for documentation workflows
 """
 
+from functools import lru_cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .core.base import DocumentSynchronizer
+
 __version__ = "0.1.0"
 __author__ = "GUARDRIVE Team"
 __email__ = "team@guardrive.io"
 
-from .core import (
-    DocSync,
-)
-from .exceptions import (
-    DocSyncError,
-    ReportGenerationError,
-    TemplateError,
-)
-from .sync_manager import SyncManager
+# Símbolos públicos e o submódulo que os define; importados sob demanda (PEP 562)
+_LAZY_ATTRS = {
+    "DocSync": ".core",
+    "DocumentSynchronizer": ".core",
+    "DocSyncError": ".exceptions",
+    "ReportGenerationError": ".exceptions",
+    "TemplateError": ".exceptions",
+    "SyncManager": ".sync_manager",
+}
 
 __all__ = [
     "DocSync",
     "DocSyncError",
+    "DocumentSynchronizer",
     "ReportGenerationError",
     "SyncManager",
     "TemplateError",
+    "get_synchronizer",
 ]
+
+
+@lru_cache(maxsize=8)
+def get_synchronizer(
+    base_path: str = ".",
+    templates_path: Optional[str] = None,
+) -> "DocumentSynchronizer":
+    """Return a shared DocumentSynchronizer for the given paths.
+
+    Instances are memoized per ``(base_path, templates_path)``; pass strings
+    so the cache key is stable.
+    """
+    from .core.base import DocumentSynchronizer
+
+    return DocumentSynchronizer(base_path=base_path, templates_path=templates_path)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
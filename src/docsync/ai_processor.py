@@ -3,21 +3,39 @@ Fornece análise, sugestões e melhorias para documentação técnica.
 """
 
 import contextlib
-import hashlib
+import copy
+import functools
 import json
 import logging
 import os
-import re
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from threading import Lock, local
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import yaml
 from watchdog.events import FileModifiedEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from .utils.config import load_yaml_cached
+
+# Extensões tratadas por DocumentProcessor.process_file
+_SUPPORTED_SUFFIXES = (".md", ".yaml", ".yml")
+
+# Seções sugeridas por _generate_suggestions, com a forma minúscula já calculada
+_COMMON_SECTIONS = tuple(
+    (section, section.lower())
+    for section in ("## Overview", "## Installation", "## Usage", "## Examples")
+)
+
+# Arquivos com histórico de eventos mantido por AIEnhancedMonitor
+_MAX_TRACKED_FILES = 10_000
+
+# Tipo de documento detectado por extensão em AIEnhancedMonitor
+_PATTERN_MAP = {"md": "markdown", "yaml": "yaml", "yml": "yaml"}
+
 
 class DocumentProcessor:
     """Processador principal de documentos com recursos de IA."""
@@ -26,9 +44,15 @@ class DocumentProcessor:
         """Inicializa o processador de documentos."""
         self.logger = logging.getLogger(__name__)
         self.config = self._load_config(config_path)
-        self.cache: Dict[str, Tuple[float, Any]] = {}  # path -> (timestamp, data)
         self.cache_ttl = cache_ttl
-        self.cache_lock = Lock()
+        # Cache limitado por (caminho, mtime, janela de TTL); entradas de
+        # arquivos alterados ou de janelas passadas saem por LRU
+        self._process_cached = functools.lru_cache(
+            maxsize=self.config.get("cache_size", 1024),
+        )(self._process_file_uncached)
+        # Marca, por thread, se a última consulta ao cache executou o corpo
+        self._lookup = local()
+        self._stats_lock = Lock()
         self.history = []
         self.stats = {
             "processed_files": 0,
@@ -43,87 +67,119 @@ class DocumentProcessor:
             "analysis_enabled": True,
             "suggestion_threshold": 0.7,
             "cache_ttl": 3600,
+            "cache_size": 1024,
             "max_suggestions": 5,
             "languages": ["pt_BR", "en"],
             "doc_types": ["technical", "api", "architecture"],
         }
 
         if config_path and config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                custom_config = yaml.safe_load(f)
-                return {**default_config, **custom_config}
+            custom_config = load_yaml_cached(
+                str(config_path),
+                config_path.stat().st_mtime_ns,
+            )
+            # Cópia: o objeto em cache é compartilhado entre processadores
+            return {**default_config, **copy.deepcopy(custom_config)}
         return default_config
 
     def process_file(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
         """Processa um arquivo com cache e extração de metadados."""
         try:
             file_path_str = str(file_path)
-            current_time = time.time()
-
-            # Verificar cache
-            with self.cache_lock:
-                if file_path_str in self.cache:
-                    timestamp, data = self.cache[file_path_str]
-                    if current_time - timestamp < self.cache_ttl:
-                        self.stats["cache_hits"] += 1
-                        return data
-                self.stats["cache_misses"] += 1
-
-            # Processar com base na extensão
-            if file_path_str.endswith(".md"):
-                result = self._process_markdown(file_path_str)
-                result["type"] = "markdown"
-            elif file_path_str.endswith((".yaml", ".yml")):
-                result = self._process_yaml(file_path_str)
-                result["type"] = "yaml"
-            else:
+            if not file_path_str.endswith(_SUPPORTED_SUFFIXES):
                 return None
 
-            # Analisar se for markdown (AI features)
-            if file_path_str.endswith(".md"):
-                analysis = self.analyze_document(Path(file_path_str))
-                result["analysis"] = analysis
-
-            # Atualizar cache
-            with self.cache_lock:
-                self.cache[file_path_str] = (current_time, result)
-
-            self.stats["processed_files"] += 1
+            mtime = os.path.getmtime(file_path_str)
+            if self.cache_ttl <= 0:
+                # TTL não positivo desativa o cache
+                return self._process_file_uncached(file_path_str, mtime, 0)
+            ttl_bucket = int(time.time() // self.cache_ttl)
+
+            # Faltas são contadas no próprio corpo, na thread que o executa
+            self._lookup.missed = False
+            result = self._process_cached(file_path_str, mtime, ttl_bucket)
+            if not self._lookup.missed:
+                self._count("cache_hits")
             return result
 
         except Exception as e:
-            self.stats["errors"] += 1
+            self._count("errors")
             msg = f"Error processing {file_path}: {e!s}"
             self.logger.error(msg)
             raise Exception(msg)
 
-    def analyze_document(self, doc_path: Path) -> dict:
+    def _process_file_uncached(
+        self,
+        file_path_str: str,
+        mtime: float,
+        ttl_bucket: int,
+    ) -> Dict[str, Any]:
+        """Processa um arquivo sem consultar o cache.
+
+        Cada execução conta como uma falta de cache. ``mtime`` e
+        ``ttl_bucket`` só fazem parte da chave do cache.
+        """
+        self._lookup.missed = True
+        self._count("cache_misses")
+
+        # Processar com base na extensão
+        if file_path_str.endswith(".md"):
+            # Lido, decodificado e separado uma vez para estrutura e análise
+            content = Path(file_path_str).read_text(encoding="utf-8")
+            metadata, body = self._extract_metadata(content)
+            result = self._process_markdown(file_path_str, content, metadata)
+            result["type"] = "markdown"
+            # Analisar markdown (AI features)
+            result["analysis"] = self._analyze(metadata, body)
+        else:
+            result = self._process_yaml(file_path_str)
+            result["type"] = "yaml"
+
+        self._count("processed_files")
+        return result
+
+    def _count(self, stat: str) -> None:
+        """Incrementa uma estatística; process_file roda em várias threads."""
+        with self._stats_lock:
+            self.stats[stat] += 1
+
+    def analyze_document(self, doc_path: Path, content: Optional[str] = None) -> dict:
         """Analisa documento e fornece insights."""
         try:
-            content = doc_path.read_text(encoding="utf-8")
+            if content is None:
+                content = doc_path.read_text(encoding="utf-8")
             metadata, body = self._extract_metadata(content)
-
-            analysis = {
-                "metadata": metadata,
-                "stats": self._analyze_stats(body),
-                "quality": self._assess_quality(body),
-                "suggestions": self._generate_suggestions(body, metadata),
-                "timestamp": datetime.now().isoformat(),
-            }
-
-            return analysis
+            return self._analyze(metadata, body)
 
         except Exception as e:
             self.logger.exception(f"Erro ao analisar documento: {e}")
             raise
 
+    def _analyze(self, metadata: dict, body: str) -> dict:
+        """Analisa um documento cujos metadados já foram separados do corpo."""
+        # Palavras e horário calculados uma vez e compartilhados
+        words = body.split()
+        timestamp = datetime.now().isoformat()
+
+        return {
+            "metadata": metadata,
+            "stats": self._analyze_stats(body, words),
+            "quality": self._assess_quality(body, words, timestamp),
+            "suggestions": self._generate_suggestions(body, metadata),
+            "timestamp": timestamp,
+        }
+
     def _extract_metadata(self, content: str) -> tuple[dict, str]:
         """Extrai e valida metadados do documento."""
+        # Sem front matter no início, não há metadados a interpretar
+        if not content.startswith("---"):
+            return {}, content
+
         try:
-            parts = content.split("---")
-            if len(parts) >= 3:
+            parts = content.split("---", 2)
+            if len(parts) == 3:
                 metadata = yaml.safe_load(parts[1]) or {}
-                body = "---".join(parts[2:]).strip()
+                body = parts[2].strip()
             else:
                 metadata = {}
                 body = content
@@ -134,9 +190,10 @@ class DocumentProcessor:
             self.logger.exception(f"Erro ao extrair metadados: {e}")
             return {}, content
 
-    def _analyze_stats(self, content: str) -> dict:
+    def _analyze_stats(self, content: str, words: Optional[List[str]] = None) -> dict:
         """Analisa estatísticas do documento."""
-        words = content.split()
+        if words is None:
+            words = content.split()
         sentences = content.split(".")
 
         return {
@@ -147,11 +204,16 @@ class DocumentProcessor:
             "code_blocks": content.count("```"),
         }
 
-    def _assess_quality(self, content: str) -> dict:
+    def _assess_quality(
+        self,
+        content: str,
+        words: Optional[List[str]] = None,
+        timestamp: Optional[str] = None,
+    ) -> dict:
         """Avalia qualidade do documento."""
         quality_metrics = {
             "completeness": self._check_completeness(content),
-            "clarity": self._analyze_clarity(content),
+            "clarity": self._analyze_clarity(content, words),
             "structure": self._evaluate_structure(content),
             "code_quality": self._check_code_quality(content),
         }
@@ -159,7 +221,7 @@ class DocumentProcessor:
         return {
             "metrics": quality_metrics,
             "score": sum(quality_metrics.values()) / len(quality_metrics),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
         }
 
     def _check_completeness(self, content: str) -> float:
@@ -168,12 +230,13 @@ class DocumentProcessor:
         present_sections = sum(1 for section in required_sections if section in content)
         return present_sections / len(required_sections)
 
-    def _analyze_clarity(self, content: str) -> float:
+    def _analyze_clarity(self, content: str, words: Optional[List[str]] = None) -> float:
         """Analisa clareza do documento."""
-        words = content.split()
+        if words is None:
+            words = content.split()
         if not words:
             return 1.0
-        complex_words = len([w for w in words if len(w) > 12])
+        complex_words = sum(1 for w in words if len(w) > 12)
         clarity_score = 1 - (complex_words / len(words))
         return min(max(clarity_score, 0), 1)
 
@@ -185,9 +248,8 @@ class DocumentProcessor:
         if not section_levels:
             return 0.0
 
-        is_hierarchical = all(
-            a <= b for a, b in zip(section_levels, section_levels[1:])
-        )
+        # sorted() (timsort) é linear para listas já ordenadas e roda em C
+        is_hierarchical = section_levels == sorted(section_levels)
         has_title = 1 in section_levels
         has_subsections = len(set(section_levels)) > 1
 
@@ -201,13 +263,23 @@ class DocumentProcessor:
 
         metrics = []
         for block in code_blocks:
-            lines = [l for l in block.split("\n") if l.strip()]
-            if len(lines) > 1:
-                indents = {len(l) - len(l.lstrip()) for l in lines}
+            # Um único lstrip por linha serve ao filtro, à indentação e aos comentários
+            indents = set()
+            line_count = 0
+            has_comments = False
+            for line in block.split("\n"):
+                stripped = line.lstrip()
+                if not stripped:
+                    continue
+                line_count += 1
+                indents.add(len(line) - len(stripped))
+                if not has_comments and stripped.startswith(("#", "//", "/*")):
+                    has_comments = True
+
+            if line_count > 1:
                 indentation_consistent = len(indents) <= 3
                 metrics.append(1.0 if indentation_consistent else 0.5)
 
-            has_comments = any(line.strip().startswith(("#", "//", "/*")) for line in lines)
             metrics.append(1.0 if has_comments else 0.7)
 
         return sum(metrics) / len(metrics) if metrics else 1.0
@@ -240,8 +312,12 @@ class DocumentProcessor:
                 "context": "Estrutura do documento",
             })
 
-        common_sections = ["## Overview", "## Installation", "## Usage", "## Examples"]
-        missing_sections = [s for s in common_sections if s.lower() not in content.lower()]
+        content_lower = content.lower()
+        missing_sections = [
+            section
+            for section, section_lower in _COMMON_SECTIONS
+            if section_lower not in content_lower
+        ]
 
         if missing_sections:
             suggestions.append({
@@ -253,67 +329,70 @@ class DocumentProcessor:
 
         return suggestions[: self.config.get("max_suggestions", 5)]
 
-    def _process_markdown(self, file_path: str) -> dict:
-        """Extrai estrutura básica de markdown."""
-        content = Path(file_path).read_text(encoding="utf-8")
-        metadata, _ = self._extract_metadata(content)
-        
+    @staticmethod
+    def _scan_markdown(content: str) -> tuple[list[dict], int]:
+        """Extrai cabeçalhos e conta blocos de código em uma única passada.
+
+        Linhas dentro de blocos de código não são tratadas como cabeçalhos;
+        blocos sem a cerca de fechamento não são contados.
+        """
         headers = []
+        code_blocks = 0
+        in_fence = False
         for line in content.split("\n"):
-            if line.startswith("#"):
-                level = len(line) - len(line.lstrip("#"))
-                text = line.lstrip("#").strip()
-                headers.append({"level": level, "text": text})
-
-        code_blocks = []
-        code_pattern = re.compile(r"```(\w+)?\n(.*?)\n```", re.DOTALL)
-        for match in code_pattern.finditer(content):
-            lang, code = match.groups()
-            code_blocks.append({"language": lang or "text", "code": code.strip()})
+            if line.startswith("```"):
+                if in_fence:
+                    code_blocks += 1
+                in_fence = not in_fence
+            elif not in_fence and line.startswith("#"):
+                text = line.lstrip("#")
+                headers.append({"level": len(line) - len(text), "text": text.strip()})
+        return headers, code_blocks
+
+    def _process_markdown(
+        self,
+        file_path: str,
+        content: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ) -> dict:
+        """Extrai estrutura básica de markdown."""
+        if content is None:
+            content = Path(file_path).read_text(encoding="utf-8")
+        if metadata is None:
+            metadata, _ = self._extract_metadata(content)
+        headers, code_blocks = self._scan_markdown(content)
 
         return {
             "metadata": metadata,
             "headers": headers,
-            "code_blocks": len(code_blocks),
+            "code_blocks": code_blocks,
             "file_path": file_path,
             "last_modified": os.path.getmtime(file_path),
         }
 
     def _process_yaml(self, file_path: str) -> dict:
         """Processa arquivos YAML."""
-        with open(file_path, encoding="utf-8") as f:
-            content = yaml.safe_load(f)
-
-        def analyze_structure(data, path="root"):
-            if isinstance(data, dict):
-                return {
-                    "type": "dict",
-                    "keys": list(data.keys()),
-                    "nested": {k: analyze_structure(v, f"{path}.{k}") for k, v in data.items()},
-                }
-            if isinstance(data, list):
-                return {
-                    "type": "list",
-                    "length": len(data),
-                    "sample": analyze_structure(data[0], f"{path}[0]") if data else None,
-                }
-            return {"type": type(data).__name__, "path": path}
+        # Cópia: o resultado é entregue ao chamador e o cache é compartilhado
+        content = copy.deepcopy(
+            load_yaml_cached(file_path, os.stat(file_path).st_mtime_ns),
+        )
 
         return {
             "content": content,
-            "structure": analyze_structure(content),
+            "structure": _analyze_structure(content),
             "file_path": file_path,
             "last_modified": os.path.getmtime(file_path),
         }
 
     def get_stats(self) -> dict:
         """Retorna estatísticas de processamento."""
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
 
     def process_directory(self, dir_path: Path) -> dict[str, dict]:
         """Processa todos os documentos em um diretório."""
         results = {}
-        for doc_path in Path(dir_path).glob("**/*.md"):
+        for doc_path in Path(dir_path).rglob("*.md"):
             try:
                 results[str(doc_path)] = self.process_file(doc_path)
             except Exception as e:
@@ -330,10 +409,47 @@ class DocumentProcessor:
         Path(output_path).write_text(json.dumps(output, indent=2), encoding="utf-8")
 
 
+def _analyze_structure(root: Any) -> dict:
+    """Descreve a estrutura de dados YAML percorrendo-a com uma pilha explícita.
+
+    Dicionários listam chaves e filhos, listas trazem o tamanho e uma amostra
+    do primeiro item, e valores escalares registram tipo e caminho. Contêineres
+    já visitados (aliases YAML, inclusive autorreferentes) são descritos apenas
+    como ``alias``; sem isso, ``a: &x [*x]`` nunca terminaria.
+    """
+    holder: Dict[str, Any] = {}
+    visited: Set[int] = set()
+    stack = [(root, "root", holder, "structure")]
+    while stack:
+        data, path, target, key = stack.pop()
+        if isinstance(data, (dict, list)):
+            if id(data) in visited:
+                target[key] = {"type": "alias", "path": path}
+                continue
+            visited.add(id(data))
+        if isinstance(data, dict):
+            nested = dict.fromkeys(data)
+            target[key] = {"type": "dict", "keys": list(data), "nested": nested}
+            stack.extend((v, f"{path}.{k}", nested, k) for k, v in data.items())
+        elif isinstance(data, list):
+            node = {"type": "list", "length": len(data), "sample": None}
+            target[key] = node
+            if data:
+                stack.append((data[0], f"{path}[0]", node, "sample"))
+        else:
+            target[key] = {"type": type(data).__name__, "path": path}
+    return holder["structure"]
+
+
 # Alias para compatibilidade com testes legados
 DocProcessor = DocumentProcessor
 
 
+def _has_glob(pattern: str) -> bool:
+    """Indica se o padrão usa curingas de glob."""
+    return any(char in pattern for char in "*?[")
+
+
 class AIEnhancedMonitor(FileSystemEventHandler):
     """Monitor de arquivos inteligente com detecção de padrões."""
 
@@ -346,7 +462,13 @@ class AIEnhancedMonitor(FileSystemEventHandler):
         self.processor = processor or DocumentProcessor()
         self.patterns = set(patterns) if patterns else {".md", ".yaml", ".yml"}
         self.ignore_patterns = set(ignore_patterns) if ignore_patterns else set()
-        self.file_history: Dict[str, List[float]] = {}
+        # Todo padrão vale como sufixo; só os que têm curingas exigem Path.match
+        self._pattern_suffixes = tuple(self.patterns)
+        self._pattern_globs = [p for p in self.patterns if _has_glob(p)]
+        self._ignore_suffixes = tuple(self.ignore_patterns)
+        self._ignore_globs = [p for p in self.ignore_patterns if _has_glob(p)]
+        # Ordenado do evento mais antigo para o mais recente
+        self.file_history: "OrderedDict[str, Deque[float]]" = OrderedDict()
         self.stats = {
             "events_processed": 0,
             "files_monitored": 0,
@@ -357,35 +479,51 @@ class AIEnhancedMonitor(FileSystemEventHandler):
     def on_modified(self, event: FileModifiedEvent) -> None:
         """Trata eventos de modificação de arquivo."""
         if not event.is_directory and self._should_process(event.src_path):
+            path = event.src_path
+            ext = Path(path).suffix[1:].lower()
+            detected = _PATTERN_MAP.get(ext, ext)
+
             with self._lock:
                 self.stats["events_processed"] += 1
-                path = event.src_path
                 current_time = time.time()
-                
-                if path not in self.file_history:
-                    self.file_history[path] = []
+
+                history = self.file_history.get(path)
+                if history is None:
+                    history = self.file_history[path] = deque()
                     self.stats["files_monitored"] += 1
+                    # Esquece os arquivos sem eventos há mais tempo
+                    if len(self.file_history) > _MAX_TRACKED_FILES:
+                        self.file_history.popitem(last=False)
+                else:
+                    self.file_history.move_to_end(path)
 
-                self.file_history[path].append(current_time)
-                self.file_history[path] = [t for t in self.file_history[path] if current_time - t < 3600]
+                history.append(current_time)
+                while current_time - history[0] >= 3600:
+                    history.popleft()
 
-                if len(self.file_history[path]) >= 1:
-                    ext = Path(path).suffix[1:].lower()
-                    pattern_map = {"md": "markdown", "yaml": "yaml", "yml": "yaml"}
-                    detected = pattern_map.get(ext, ext)
-                    self.stats["patterns_detected"].add(detected)
+                self.stats["patterns_detected"].add(detected)
 
-                with contextlib.suppress(Exception):
-                    self.processor.process_file(path)
+            with contextlib.suppress(Exception):
+                self.processor.process_file(path)
 
     def _should_process(self, path: str) -> bool:
         """Verifica se o arquivo deve ser processado."""
         path_str = str(path)
         # Check ignore patterns (handling both glob-like and extension-like)
-        if any(path_str.endswith(pat) or Path(path_str).match(pat) for pat in self.ignore_patterns):
+        if self._matches(path_str, self._ignore_suffixes, self._ignore_globs):
             return False
         # Check include patterns
-        return any(path_str.endswith(pat) or Path(path_str).match(pat) for pat in self.patterns)
+        return self._matches(path_str, self._pattern_suffixes, self._pattern_globs)
+
+    @staticmethod
+    def _matches(path_str: str, suffixes: Tuple[str, ...], globs: List[str]) -> bool:
+        """Testa sufixos em uma única chamada e só então os padrões glob."""
+        if path_str.endswith(suffixes):
+            return True
+        if not globs:
+            return False
+        path = Path(path_str)
+        return any(path.match(pattern) for pattern in globs)
 
     def get_stats(self) -> dict:
         """Retorna estatísticas de monitoramento."""
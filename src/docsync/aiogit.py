@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from git import Repo
@@ -10,10 +11,18 @@ logger = logging.getLogger("aiogit-sovereign")
 class Repository:
     """Sovereign Adapter for GitPython to match aiogit interface."""
 
+    # Shared by every repository so git calls reuse the same worker threads
+    _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aiogit")
+
     def __init__(self, repo_path: Path):
         self.path = Path(repo_path)
         self._repo = None
 
+    async def _run(self, func, *args):
+        """Runs a blocking GitPython call on the shared executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     @classmethod
     async def create(cls, path: Path):
         """Mock create - returns instance to be initialized."""
@@ -24,7 +33,7 @@ class Repository:
         """Opens an existing repository."""
         instance = cls(path)
         try:
-            instance._repo = Repo(path)
+            instance._repo = await instance._run(Repo, path)
             return instance
         except Exception as e:
             logger.error(f"Failed to open repo at {path}: {e}")
@@ -32,21 +41,29 @@ class Repository:
 
     async def init(self):
         """Initializes a new git repository."""
-        loop = asyncio.get_event_loop()
-        self._repo = await loop.run_in_executor(None, Repo.init, self.path)
+        self._repo = await self._run(Repo.init, self.path)
 
     async def add_all(self):
         """Adds all changes to the index."""
         if not self._repo:
             self._repo = Repo(self.path)
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._repo.git.add, "--all")
+        await self._run(self._repo.git.add, "--all")
 
     async def commit(self, message: str):
         """Commits changes with the given message."""
         if not self._repo:
             self._repo = Repo(self.path)
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._repo.index.commit, message)
+        await self._run(self._repo.index.commit, message)
+
+    async def add_all_and_commit(self, message: str):
+        """Adds all changes and commits them in a single executor call."""
+        if not self._repo:
+            self._repo = Repo(self.path)
+
+        def _add_and_commit():
+            self._repo.git.add("--all")
+            return self._repo.index.commit(message)
+
+        return await self._run(_add_and_commit)
@@ -22,6 +22,8 @@ from typing import Any, Union
 import yaml
 from yaml.parser import ParserError
 
+from .utils.config import YamlLoader
+
 # Configuração do logging
 logger = logging.getLogger(__name__)
 
@@ -215,7 +217,7 @@ def load_config(config_path: Union[str, Path, None] = None) -> dict[str, Any]:
         try:
             if config_path.exists():
                 with open(config_path, encoding="utf-8") as f:
-                    file_config = yaml.safe_load(f)
+                    file_config = yaml.load(f, Loader=YamlLoader)
                     if file_config:
                         _deep_update(config, file_config)
                 logger.info(f"Configuração carregada de {config_path}")
@@ -1,12 +1,20 @@
 """Core functionality for DocSync system."""
 
+from importlib import import_module
+from typing import Any
+
 from ..exceptions import (
     DocSyncError,
     ReportGenerationError,
     TemplateError,
 )
-from .base import DocumentSynchronizer
-from .sync import DocSync
+
+# Loaded on first access (PEP 562) so DocumentSynchronizer does not pull in
+# the Rich logging setup of DocSync
+_LAZY_ATTRS = {
+    "DocSync": ".sync",
+    "DocumentSynchronizer": ".base",
+}
 
 __all__ = [
     "DocSync",
@@ -15,3 +23,18 @@ __all__ = [
     "ReportGenerationError",
     "TemplateError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,290 @@
 """Base synchronization components for DocSync."""
 
+import contextlib
+import hashlib
 import logging
+import os
+import sys
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Optional, TextIO, Union
+
+import jinja2
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    TemplateNotFound,
+    select_autoescape,
+)
+from jinja2.bccache import Bucket
+
+from docsync.exceptions import ReportGenerationError, TemplateError
+from docsync.utils.filters import FILTERS
+
+# Templates shipped with the package
+DEFAULT_TEMPLATES_PATH = Path(__file__).resolve().parent.parent / "templates"
+
+# Precompiled templates produced before packaging (see ``compile_templates``)
+COMPILED_TEMPLATES_PATH = DEFAULT_TEMPLATES_PATH.with_name("templates_compiled.zip")
+
+# Compiled template bytecode, reused across runs
+BYTECODE_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "docsync"
+    / "jinja"
+)
+
+# Write buffer for generated reports
+OUTPUT_BUFFER_SIZE = 128 * 1024
+
+# Process umask, applied to reports written through a temporary file
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Shared Jinja2 environments, one per (templates directory, encoding)
+_environments: dict[tuple[Path, str], Environment] = {}
+
+# Environments whose templates are already compiled (preloaded or archived)
+_preloaded: set[tuple[Path, str]] = set()
+
+
+class DocSyncBytecodeCache(FileSystemBytecodeCache):
+    """On-disk bytecode cache addressed by template content.
+
+    Each ``.jbc`` file name combines the source hash, the template name and
+    filename, the environment options that change the generated code and the
+    Jinja2 and Python versions. Identical sources under other names or from
+    differently configured environments therefore never share bytecode,
+    and upgrading Jinja2 or Python never reuses incompatible bytecode.
+    """
+
+    def __init__(self, directory: Union[str, Path] = BYTECODE_CACHE_PATH) -> None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory), pattern="%s.jbc")
+
+    @staticmethod
+    def _environment_fingerprint(environment: Environment, name: str) -> str:
+        """Describe the environment options compiled into a template."""
+        autoescape = environment.autoescape
+        if callable(autoescape):
+            autoescape = autoescape(name)
+        return repr(
+            (
+                environment.block_start_string,
+                environment.block_end_string,
+                environment.variable_start_string,
+                environment.variable_end_string,
+                environment.comment_start_string,
+                environment.comment_end_string,
+                environment.line_statement_prefix,
+                environment.line_comment_prefix,
+                environment.trim_blocks,
+                environment.lstrip_blocks,
+                environment.newline_sequence,
+                environment.keep_trailing_newline,
+                environment.optimized,
+                environment.is_async,
+                bool(autoescape),
+                sorted(environment.extensions),
+                sorted(environment.filters),
+                sorted(environment.tests),
+            ),
+        )
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: Optional[str],
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        fingerprint = self._environment_fingerprint(environment, name)
+        key = hashlib.sha1(
+            f"{checksum}|{name}|{filename}|{fingerprint}|"
+            f"{jinja2.__version__}|{sys.version_info[:2]}".encode(),
+        ).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        return bucket
+
+
+def _create_environment(loader: BaseLoader, **options: Any) -> Environment:
+    """Create a Jinja2 environment with DocSync options and filters."""
+    env = Environment(
+        loader=loader,
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=400,
+        **options,
+    )
+    env.filters.update(FILTERS)
+    return env
+
+
+def preload_templates(env: Environment) -> int:
+    """Compile every ``.jinja`` template of an environment ahead of use.
+
+    Compiled templates land in the environment cache (and in its bytecode
+    cache, if any), so the first render does not pay for compilation.
+    Templates that fail to compile are skipped and raise on actual use.
+
+    Args:
+        env: Environment to warm up
+
+    Returns:
+        int: Number of templates loaded
+    """
+    loaded = 0
+    for name in env.list_templates(extensions=["jinja"]):
+        try:
+            env.get_template(name)
+        except jinja2.TemplateError:
+            continue
+        loaded += 1
+    return loaded
+
+
+@contextlib.contextmanager
+def open_report(path: Path) -> Iterator[TextIO]:
+    """Open a buffered report file that replaces ``path`` only on success.
+
+    Output goes to a temporary file in the same directory, which is moved
+    over ``path`` once the block completes. If the block raises, the
+    temporary file is removed and an existing report is left untouched.
+
+    Args:
+        path: Final report path; its directory must exist
+
+    Yields:
+        TextIO: UTF-8 text file to write the report to
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        buffering=OUTPUT_BUFFER_SIZE,
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with tmp:
+            yield tmp
+        # NamedTemporaryFile is private (0600); give the report the usual mode
+        os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp.name)
+        raise
+
+
+def compile_templates(
+    templates_path: Union[str, Path] = DEFAULT_TEMPLATES_PATH,
+    target: Union[str, Path] = COMPILED_TEMPLATES_PATH,
+) -> Path:
+    """Precompile templates into a zip archive loadable by ModuleLoader.
+
+    Templates that do not compile with the DocSync filters are left out of
+    the archive and keep being loaded from the source directory.
+
+    Args:
+        templates_path: Templates directory
+        target: Destination zip file
+
+    Returns:
+        Path: Path of the generated archive
+    """
+    env = _create_environment(FileSystemLoader(str(templates_path)))
+    env.compile_templates(
+        str(target),
+        extensions=["jinja"],
+        zip="deflated",
+        ignore_errors=True,
+    )
+    return Path(target)
+
+
+def _compiled_templates_current(
+    archive: Path = COMPILED_TEMPLATES_PATH,
+    templates_path: Path = DEFAULT_TEMPLATES_PATH,
+) -> bool:
+    """Tell whether a precompiled archive is newer than every source template.
+
+    A stale archive (a template edited after ``compile_templates`` ran, as in
+    an editable install) must not shadow the sources.
+
+    Args:
+        archive: Precompiled templates archive
+        templates_path: Templates directory the archive was built from
+
+    Returns:
+        bool: ``True`` if the archive exists and is up to date
+    """
+    try:
+        built = archive.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    return all(
+        template.stat().st_mtime_ns <= built
+        for template in templates_path.rglob("*.jinja")
+    )
+
+
+def get_environment(
+    templates_path: Union[str, Path],
+    encoding: str = "utf-8",
+    preload: bool = False,
+) -> Environment:
+    """Return the shared Jinja2 environment for a templates directory.
+
+    The environment caches compiled templates, so successive report
+    generations and new synchronizer, orchestrator or renderer instances
+    reuse parsing and compilation. Package templates are loaded from the
+    precompiled archive when it is newer than every source template;
+    otherwise bytecode is written to disk so new processes skip recompiling.
+
+    Args:
+        templates_path: Templates directory
+        encoding: Encoding of the template files
+        preload: Compile every template now instead of on first use
+
+    Returns:
+        Environment: Environment configured with the DocSync filters
+    """
+    key = (Path(templates_path).resolve(), encoding)
+    env = _environments.get(key)
+    if env is None:
+        source_loader = FileSystemLoader(str(key[0]), encoding=encoding)
+        if key[0] == DEFAULT_TEMPLATES_PATH and _compiled_templates_current():
+            env = _create_environment(
+                ChoiceLoader(
+                    [ModuleLoader(str(COMPILED_TEMPLATES_PATH)), source_loader],
+                ),
+            )
+            # Archived templates need no warm-up
+            _preloaded.add(key)
+        else:
+            try:
+                bytecode_cache = DocSyncBytecodeCache()
+            except OSError:
+                bytecode_cache = None
+            env = _create_environment(source_loader, bytecode_cache=bytecode_cache)
+        _environments[key] = env
+
+    if preload and key not in _preloaded:
+        preload_templates(env)
+        _preloaded.add(key)
+    return env
 
 
 class DocumentSynchronizer:
@@ -10,7 +292,7 @@ class DocumentSynchronizer:
 
     def __init__(
         self,
-        base_path: Union[str, Path],
+        base_path: Union[str, Path] = ".",
         templates_path: Optional[Union[str, Path]] = None,
     ) -> None:
         self.base_path = Path(base_path)
@@ -21,6 +303,8 @@ class DocumentSynchronizer:
         if self.templates_path:
             self.templates_path.mkdir(parents=True, exist_ok=True)
 
+        self._env = get_environment(self.templates_path or DEFAULT_TEMPLATES_PATH)
+
     def sync_document(self, doc_path: Union[str, Path]) -> dict[str, Any]:
         """Synchronize a document."""
         try:
@@ -33,3 +317,85 @@ class DocumentSynchronizer:
 
             msg = f"Failed to sync document: {e}"
             raise DocSyncError(msg)
+
+    def _get_template(self, template_name: str, format: str) -> Template:
+        """Look up a compiled template in the shared environment."""
+        template_file = f"{template_name}.{format}.jinja"
+        try:
+            return self._env.get_template(template_file)
+        except TemplateNotFound as e:
+            msg = f"Template not found: {template_file}"
+            raise TemplateError(msg) from e
+
+    def render(
+        self,
+        template_name: str,
+        data: dict[str, Any],
+        format: str = "md",
+    ) -> str:
+        """Render a report template to a string without writing it.
+
+        ``data`` is read-only: it is passed to the template as-is, never
+        copied or mutated, and the caller retains ownership.
+
+        Args:
+            template_name: Template name without extension
+            data: Report data, exposed to the template as ``report``
+            format: Template format (``md`` or ``html``)
+
+        Returns:
+            str: Rendered content
+
+        Raises:
+            TemplateError: If the template does not exist
+            ReportGenerationError: If rendering fails
+        """
+        template = self._get_template(template_name, format)
+        try:
+            return template.render(report=data)
+        except Exception as e:
+            msg = f"Failed to render template {template_name}: {e}"
+            raise ReportGenerationError(msg) from e
+
+    def generate_report(
+        self,
+        template_name: str,
+        output_path: Union[str, Path],
+        data: dict[str, Any],
+        format: str = "md",
+    ) -> Path:
+        """Generate a report from a template.
+
+        ``data`` is read-only: it is passed to the template as-is, never
+        copied or mutated, and the caller retains ownership.
+
+        Args:
+            template_name: Template name without extension (e.g.
+                ``guardrive/esg_report``)
+            output_path: Destination file
+            data: Report data, exposed to the template as ``report``
+            format: Output format (``md`` or ``html``)
+
+        Returns:
+            Path: Path of the generated report
+
+        Raises:
+            TemplateError: If the template does not exist
+            ReportGenerationError: If rendering or writing fails
+        """
+        template = self._get_template(template_name, format)
+
+        try:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write the template in chunks without materializing the whole
+            # document; the previous report survives a failed render
+            with open_report(output_path) as f:
+                template.stream(report=data).dump(f)
+        except Exception as e:
+            msg = f"Failed to generate report {output_path}: {e}"
+            raise ReportGenerationError(msg) from e
+
+        self.logger.info("Report generated: %s", output_path)
+        return output_path
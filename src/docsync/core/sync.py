@@ -2,11 +2,12 @@
 
 import logging
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from rich.console import Console
 from rich.logging import RichHandler
 
+from docsync.plugins.base import DocumentFormat
 from docsync.utils.config import load_config
 
 
@@ -61,6 +62,9 @@ class DocSync:
         self.monitor = FileMonitor(MonitorConfig(paths=[self.base_path]))
         self.observer = self.monitor.observer
 
+        # Registro de plugins
+        self._plugins: dict[str, DocumentFormat] = {}
+
         # Criar diretório base se não existir
         self.base_path.mkdir(parents=True, exist_ok=True)
 
@@ -88,3 +92,100 @@ class DocSync:
     def sync_documents(self) -> None:
         """Sincroniza documentos (placeholder)."""
         self.logger.info("🔄 Sincronizando documentos...")
+
+    def register_plugin(self, plugin: DocumentFormat) -> None:
+        """Registra um plugin de formato de documento.
+
+        Args:
+            plugin: Instância do plugin
+        """
+        try:
+            plugin.initialize(
+                self.config.get("plugins", {}).get(plugin.metadata.name, {}),
+            )
+            self._plugins[plugin.metadata.name] = plugin
+            self.logger.info(
+                "✨ Plugin registrado: %s v%s",
+                plugin.metadata.name,
+                plugin.metadata.version,
+            )
+        except Exception:
+            self.logger.exception(
+                "❌ Erro ao registrar plugin %s",
+                plugin.metadata.name,
+            )
+            raise
+
+    def unregister_plugin(self, name: str) -> None:
+        """Remove registro de um plugin.
+
+        Args:
+            name: Nome do plugin
+        """
+        if name in self._plugins:
+            try:
+                self._plugins[name].cleanup()
+                del self._plugins[name]
+                self.logger.info("🗑️ Plugin removido: %s", name)
+            except Exception:
+                self.logger.exception("❌ Erro ao remover plugin %s", name)
+                raise
+
+    def get_plugin(self, name: str) -> Optional[DocumentFormat]:
+        """Obtém plugin pelo nome.
+
+        Args:
+            name: Nome do plugin
+
+        Returns:
+            Optional[DocumentFormat]: Plugin ou None se não encontrado
+        """
+        return self._plugins.get(name)
+
+    def find_plugin_for_file(self, file_path: Path) -> Optional[DocumentFormat]:
+        """Encontra plugin capaz de processar arquivo.
+
+        Args:
+            file_path: Caminho do arquivo
+
+        Returns:
+            Optional[DocumentFormat]: Plugin ou None se não encontrado
+        """
+        for plugin in self._plugins.values():
+            if plugin.can_handle(file_path):
+                return plugin
+        return None
+
+    def process_document(
+        self,
+        file_path: Path,
+        plugin_name: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Processa documento usando plugin apropriado.
+
+        Args:
+            file_path: Caminho do arquivo
+            plugin_name: Nome do plugin (opcional)
+
+        Returns:
+            Dict[str, Any]: Resultado do processamento
+
+        Raises:
+            ValueError: Se nenhum plugin puder processar arquivo
+        """
+        if plugin_name:
+            plugin = self.get_plugin(plugin_name)
+            if not plugin:
+                msg = f"Plugin não encontrado: {plugin_name}"
+                raise ValueError(msg)
+        else:
+            plugin = self.find_plugin_for_file(file_path)
+            if not plugin:
+                msg = f"Nenhum plugin pode processar: {file_path}"
+                raise ValueError(msg)
+
+        self.logger.info("🔄 Processando %s com %s", file_path, plugin.metadata.name)
+        result = plugin.read_document(file_path)
+        result["plugin"] = plugin.metadata.name
+        result["file_path"] = str(file_path)
+        return result
@@ -19,6 +19,7 @@ from typing import Optional
 
 from ...exceptions import DocSyncError
 from ...sync_manager import SyncManager
+from ...utils import hash_file
 from .client import NotionClient
 from .config import NotionConfig, NotionMapping
 
@@ -97,8 +98,7 @@ class NotionBridge:
                     continue
 
                 rel_path = str(file.relative_to(mapping.source_path))
-                content = file.read_text(encoding="utf-8")
-                file_hash = hashlib.sha256(content.encode()).hexdigest()
+                file_hash = hash_file(file)
 
                 data["files"][rel_path] = {
                     "hash": file_hash,
@@ -167,8 +167,7 @@ class NotionBridge:
                 continue
 
             rel_path = str(file.relative_to(mapping.source_path))
-            content = file.read_text()
-            current_hash = hashlib.sha256(content.encode()).hexdigest()
+            current_hash = hash_file(file)
 
             file_data = sync_data["files"].get(rel_path, {})
             stored_hash = file_data.get("hash")
@@ -226,11 +225,12 @@ class NotionBridge:
             if notion_updated > local_updated:
                 # Atualizar arquivo local
                 content = await self._convert_notion_to_markdown(page)
-                local_path.write_text(content, encoding="utf-8")
+                data = content.encode("utf-8")
+                local_path.write_bytes(data)
 
                 rel_path = str(local_path.relative_to(mapping.source_path))
                 sync_data["files"][rel_path] = {
-                    "hash": hashlib.sha256(content.encode()).hexdigest(),
+                    "hash": hashlib.sha256(data).hexdigest(),
                     "last_modified": notion_updated.isoformat(),
                     "notion_id": notion_id,
                 }
@@ -9,9 +9,26 @@ NotionConfig: Configuração principal da integração
 NotionMapping: Mapeamento entre diretório local e página/database Notion
 """
 
-from dataclasses import dataclass
+import fnmatch
+import os
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# fnmatch diferencia maiúsculas de minúsculas, exceto no Windows
+_PATTERN_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern:
+    """Combina padrões glob em uma única expressão regular."""
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile(
+        "|".join(fnmatch.translate(pattern) for pattern in patterns),
+        _PATTERN_FLAGS,
+    )
 
 
 @dataclass
@@ -24,6 +41,8 @@ class NotionMapping:
     file_patterns: list[str] = None  # Ex: ["*.md", "*.txt"]
     ignore_patterns: list[str] = None  # Ex: ["*.tmp", ".*"]
     metadata: dict[str, Any] = None
+    _file_re: re.Pattern = field(init=False, repr=False, compare=False)
+    _ignore_re: re.Pattern = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # Garantir que source_path seja Path
@@ -38,6 +57,17 @@ class NotionMapping:
         if self.metadata is None:
             self.metadata = {}
 
+        self._file_re = _compile_patterns(self.file_patterns)
+        self._ignore_re = _compile_patterns(self.ignore_patterns)
+
+    def matches(self, name: str) -> bool:
+        """Verifica se o nome de arquivo casa com algum de file_patterns."""
+        return self._file_re.match(name) is not None
+
+    def ignores(self, name: str) -> bool:
+        """Verifica se o nome de arquivo casa com algum de ignore_patterns."""
+        return self._ignore_re.match(name) is not None
+
     def validate(self) -> bool:
         """Valida o mapeamento."""
         if not self.source_path.exists():
@@ -98,13 +128,21 @@ class NotionConfig:
 
         return True
 
-    def get_headers(self) -> dict[str, str]:
-        """Retorna os headers para requisições."""
-        return self.headers.copy()
+    def get_headers(self) -> Mapping[str, str]:
+        """Retorna os headers para requisições.
+
+        A visão é somente leitura; use ``dict(config.get_headers())`` para
+        obter uma cópia alterável.
+        """
+        return MappingProxyType(self.headers)
+
+    def get_timeout(self) -> Mapping[str, int]:
+        """Retorna as configurações de timeout.
 
-    def get_timeout(self) -> dict[str, int]:
-        """Retorna as configurações de timeout."""
-        return self.timeout.copy()
+        A visão é somente leitura; use ``dict(config.get_timeout())`` para
+        obter uma cópia alterável.
+        """
+        return MappingProxyType(self.timeout)
 
 
 # Modos de sincronização suportados
@@ -6,7 +6,6 @@ Configuração e fixtures comuns para testes do módulo Notion.
 
 import logging
 import os
-import shutil
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
@@ -48,6 +47,67 @@ TEST_DATA = {
 }
 
 
+class FileHelper:
+    """Manipula arquivos de teste em um diretório de documentos."""
+
+    def __init__(self, docs_path: Path) -> None:
+        self.docs_path = docs_path
+
+    def create_file(self, name: str, content: str) -> Path:
+        path = self.docs_path / name
+        path.write_text(content)
+        return path
+
+    def read_file(self, name: str) -> str:
+        path = self.docs_path / name
+        return path.read_text()
+
+    def delete_file(self, name: str) -> None:
+        path = self.docs_path / name
+        path.unlink()
+
+
+class MockSession:
+    """Sessão HTTP simulada com respostas registradas por método e URL."""
+
+    def __init__(self) -> None:
+        self.responses = {}
+        self.calls = []
+
+    def add_response(
+        self,
+        method: str,
+        url: str,
+        response: dict,
+        status: int = 200,
+    ) -> None:
+        key = f"{method}:{url}"
+        self.responses[key] = (status, response)
+
+    async def request(self, method: str, url: str, **kwargs):
+        key = f"{method}:{url}"
+        self.calls.append((method, url, kwargs))
+
+        status, response = self.responses.get(key, (200, {"id": "test_id"}))
+        return self.mock_response(status, response)
+
+    def mock_response(self, status: int, data: dict):
+        mock = Mock()
+        mock.status = status
+        mock.headers = {
+            "x-ratelimit-remaining": "100",
+            "x-ratelimit-reset": str(int(datetime.now().timestamp()) + 3600),
+        }
+        mock.json = AsyncMock(return_value=data)
+        return mock
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
 @pytest.fixture
 def test_data():
     """Retorna dados de teste padrão."""
@@ -86,10 +146,8 @@ def temp_workspace(tmp_path):
     (docs / "test1.md").write_text("# Test 1\nContent 1")
     (docs / "test2.md").write_text("# Test 2\nContent 2")
 
-    yield workspace
-
-    # Cleanup
-    shutil.rmtree(workspace)
+    # tmp_path é removido pelo próprio pytest
+    return workspace
 
 
 @pytest.fixture
@@ -112,66 +170,12 @@ def test_config(temp_workspace):
 @pytest.fixture
 def file_helper(temp_workspace):
     """Helper para manipulação de arquivos de teste."""
-
-    class FileHelper:
-        def create_file(self, name: str, content: str) -> Path:
-            path = temp_workspace / "docs" / name
-            path.write_text(content)
-            return path
-
-        def read_file(self, name: str) -> str:
-            path = temp_workspace / "docs" / name
-            return path.read_text()
-
-        def delete_file(self, name: str) -> None:
-            path = temp_workspace / "docs" / name
-            path.unlink()
-
-    return FileHelper()
+    return FileHelper(temp_workspace / "docs")
 
 
 @pytest.fixture
 def mock_http_session():
     """Mock para sessão HTTP."""
-
-    class MockSession:
-        def __init__(self) -> None:
-            self.responses = {}
-            self.calls = []
-
-        def add_response(
-            self,
-            method: str,
-            url: str,
-            response: dict,
-            status: int = 200,
-        ) -> None:
-            key = f"{method}:{url}"
-            self.responses[key] = (status, response)
-
-        async def request(self, method: str, url: str, **kwargs):
-            key = f"{method}:{url}"
-            self.calls.append((method, url, kwargs))
-
-            status, response = self.responses.get(key, (200, {"id": "test_id"}))
-            return self.mock_response(status, response)
-
-        def mock_response(self, status: int, data: dict):
-            mock = Mock()
-            mock.status = status
-            mock.headers = {
-                "x-ratelimit-remaining": "100",
-                "x-ratelimit-reset": str(int(datetime.now().timestamp()) + 3600),
-            }
-            mock.json = AsyncMock(return_value=data)
-            return mock
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc_val, exc_tb):
-            pass
-
     return MockSession()
 
 
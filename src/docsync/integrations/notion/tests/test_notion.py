@@ -108,24 +108,26 @@ def mock_api_response(test_data):
     return create_response
 
 
-@pytest.fixture
-def file_helper(tmp_path):
-    """Helper para manipulação de arquivos de teste."""
+class FileHelper:
+    """Cria arquivos Markdown de teste sob um diretório base."""
+
+    def __init__(self, base_path) -> None:
+        self.base_path = base_path
 
-    class FileHelper:
-        def __init__(self, base_path) -> None:
-            self.base_path = base_path
+    def create_markdown(self, name, content):
+        path = self.base_path / name
+        path.write_text(content)
+        return path
 
-        def create_markdown(self, name, content):
-            path = self.base_path / name
-            path.write_text(content)
-            return path
+    def create_test_structure(self):
+        docs = self.base_path / "docs"
+        docs.mkdir(exist_ok=True)
+        return self.create_markdown("docs/test.md", "# Test\nContent")
 
-        def create_test_structure(self):
-            docs = self.base_path / "docs"
-            docs.mkdir(exist_ok=True)
-            return self.create_markdown("docs/test.md", "# Test\nContent")
 
+@pytest.fixture
+def file_helper(tmp_path):
+    """Helper para manipulação de arquivos de teste."""
     return FileHelper(tmp_path)
 
 
@@ -8,8 +8,11 @@ Date: 2025-06-03
 """
 
 import asyncio
-import hashlib
 import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
@@ -19,16 +22,25 @@ from typing import Optional, Any
 import aiofiles
 import aiofiles.os
 from croniter import croniter
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
 from . import aiogit
 from .config import Config, DocumentType, PathMappingConfig
-from .utils import setup_logger
+from .utils import file_signature, setup_logger
 
 # Configuração do logging
 logger = setup_logger(__name__)
 
+# Eventos de acesso do watchdog que não alteram conteúdo
+_IGNORED_EVENT_TYPES = frozenset({"opened", "closed", "closed_no_write"})
+
+# Número máximo de hashes de arquivo mantidos em memória
+_HASH_CACHE_SIZE = 4096
+
+# Capacidade da fila de arquivos aguardando sincronização
+_EVENT_QUEUE_SIZE = 4096
+
 
 class SyncStatus(Enum):
     """Status possíveis de sincronização."""
@@ -44,6 +56,17 @@ class SyncStatus(Enum):
 class FileMetadata:
     """Metadados de arquivo para controle de sincronização."""
 
+    # Declarado manualmente: dataclass(slots=True) exige Python 3.10+
+    __slots__ = (
+        "path",
+        "hash",
+        "modified_time",
+        "size",
+        "doc_type",
+        "last_sync",
+        "status",
+    )
+
     path: Path
     hash: str
     modified_time: float
@@ -147,7 +170,7 @@ class DocumentHandler(FileSystemEventHandler):
             target.parent.mkdir(parents=True, exist_ok=True)
 
             # Executa shutil.copy2 em um pool de threads para não bloquear o loop de eventos
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, shutil.copy2, str(source), str(target))
         except Exception as e:
             logger.error(f"Erro ao copiar arquivo {source} -> {target}: {e}")
@@ -188,9 +211,8 @@ class VersionController:
 
         try:
             repo = await aiogit.Repository.open(path)
-            await repo.add_all()
             message = self.commit_template.format(action=action, path=path)
-            await repo.commit(message)
+            await repo.add_all_and_commit(message)
             return True
         except Exception as e:
             logger.exception(f"Erro ao commitar alterações: {e}")
@@ -213,14 +235,36 @@ class VersionController:
 
 
 class FileSystemMonitor(FileSystemEventHandler):
-    """Monitor de alterações no sistema de arquivos."""
+    """Monitor de alterações no sistema de arquivos.
+
+    Eventos do watchdog chegam em rajadas (editores costumam gravar, renomear
+    e modificar o mesmo arquivo várias vezes por salvamento). Os eventos são
+    agrupados por caminho durante ``debounce_interval`` segundos e cada
+    caminho é enfileirado uma única vez por janela. Se a fila do gerenciador
+    estiver cheia, os caminhos restantes voltam para o agrupamento e são
+    reenviados na janela seguinte.
+    """
 
-    def __init__(self, sync_manager: "SyncManager") -> None:
+    debounce_interval = 0.2
+
+    def __init__(
+        self,
+        sync_manager: "SyncManager",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        super().__init__()
         self.sync_manager = sync_manager
         self.observer = Observer()
+        self._loop = loop
+        self._pending: dict[str, str] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._overflow_count = 0
 
     def start(self) -> None:
         """Inicia monitoramento de diretórios."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
         for path in self.sync_manager.watch_paths:
             self.observer.schedule(self, path, recursive=True)
         self.observer.start()
@@ -230,11 +274,91 @@ class FileSystemMonitor(FileSystemEventHandler):
         self.observer.stop()
         self.observer.join()
 
-    def on_modified(self, event) -> None:
-        """Manipula eventos de modificação de arquivo."""
-        if event.is_directory:
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Acumula eventos de arquivo na janela de agrupamento atual."""
+        if (
+            event.is_directory
+            or self._loop is None
+            or event.event_type in _IGNORED_EVENT_TYPES
+        ):
+            return
+
+        moved = event.event_type == "moved"
+        src_watched = self.sync_manager._is_watched(Path(event.src_path))
+        dest_watched = moved and self.sync_manager._is_watched(Path(event.dest_path))
+        if not (src_watched or dest_watched):
             return
-        asyncio.create_task(self.sync_manager.handle_file_change(Path(event.src_path)))
+
+        with self._pending_lock:
+            if not moved:
+                self._coalesce(event.src_path, event.event_type)
+            else:
+                # Cada lado da renomeação só conta se o caminho for monitorado
+                if src_watched:
+                    self._coalesce(event.src_path, "deleted")
+                if dest_watched:
+                    self._coalesce(event.dest_path, "created")
+
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+
+        if schedule:
+            self._loop.call_soon_threadsafe(
+                self._loop.call_later,
+                self.debounce_interval,
+                self._flush,
+            )
+
+    def _coalesce(self, path: str, event_type: str) -> None:
+        """Combina um evento com o evento pendente do mesmo caminho."""
+        previous = self._pending.get(path)
+
+        if event_type == "deleted":
+            if previous == "created":
+                # Criado e removido na mesma janela: nada a sincronizar
+                del self._pending[path]
+            else:
+                self._pending[path] = "deleted"
+        elif event_type == "created":
+            self._pending[path] = "modified" if previous == "deleted" else "created"
+        elif event_type == "modified":
+            if previous != "created":
+                self._pending[path] = "modified"
+
+    def _flush(self) -> None:
+        """Envia os caminhos acumulados para a fila do gerenciador."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._flush_scheduled = False
+
+        queue = self.sync_manager.event_queue
+        items = iter(pending.items())
+        for path, event_type in items:
+            if event_type == "deleted":
+                continue
+            try:
+                queue.put_nowait(Path(path))
+            except asyncio.QueueFull:
+                self._requeue([(path, event_type), *items])
+                break
+
+    def _requeue(self, items: list[tuple[str, str]]) -> None:
+        """Devolve ao agrupamento caminhos que não couberam na fila."""
+        self._overflow_count += len(items)
+        logger.warning(
+            f"Fila de sincronização cheia; {len(items)} arquivo(s) adiados "
+            f"({self._overflow_count} no total)",
+        )
+
+        with self._pending_lock:
+            for path, event_type in items:
+                # Eventos mais recentes do mesmo caminho têm precedência
+                self._pending.setdefault(path, event_type)
+            schedule = not self._flush_scheduled
+            self._flush_scheduled = True
+
+        if schedule:
+            self._loop.call_later(self.debounce_interval, self._flush)
 
 
 class SyncManager:
@@ -269,15 +393,31 @@ class SyncManager:
 
         # Caminhos para monitoramento
         self.watch_paths = self._setup_watch_paths()
+        self.watched_extensions = frozenset(
+            ext
+            for handler in self.doc_handlers.values()
+            for ext in handler.supported_extensions
+        )
+
+        # Monitor de sistema de arquivos; os eventos chegam pela thread do
+        # watchdog e são repassados ao loop em que o gerenciador foi criado
+        self._loop = asyncio.get_running_loop()
+        self.monitor = FileSystemMonitor(self, loop=self._loop)
 
-        # Monitor de sistema de arquivos
-        self.monitor = FileSystemMonitor(self)
+        # Fila de arquivos alterados e tarefa que a consome (criada em start)
+        self.event_queue: asyncio.Queue[Path] = asyncio.Queue(
+            maxsize=_EVENT_QUEUE_SIZE,
+        )
+        self._event_worker: Optional[asyncio.Task] = None
 
         # Cache de metadados
         self.file_metadata: dict[Path, FileMetadata] = {}
 
+        # Último hash calculado por arquivo, com o (mtime_ns, tamanho) da leitura
+        self._hash_cache: OrderedDict[Path, tuple[int, int, str]] = OrderedDict()
+
         # Scheduler para sincronização programada
-        self.scheduler = asyncio.create_task(self._run_scheduler())
+        self.scheduler = self._loop.create_task(self._run_scheduler())
 
     def _setup_watch_paths(self) -> set[Path]:
         """Configura caminhos para monitoramento."""
@@ -299,11 +439,13 @@ class SyncManager:
         logger.info("Iniciando gerenciador de sincronização...")
 
         # Inicializa repositórios de versão
-        for path in self.watch_paths:
-            await self.version_control.initialize_repo(path)
+        await asyncio.gather(
+            *(self.version_control.initialize_repo(path) for path in self.watch_paths),
+        )
 
         # Inicia monitoramento de arquivos
         if self.sync_config.real_time_sync:
+            self._event_worker = self._loop.create_task(self._process_events())
             self.monitor.start()
 
         # Realiza sincronização inicial
@@ -318,6 +460,10 @@ class SyncManager:
         if self.sync_config.real_time_sync:
             self.monitor.stop()
 
+        if self._event_worker is not None:
+            self._event_worker.cancel()
+            self._event_worker = None
+
         self.scheduler.cancel()
 
         logger.info("Gerenciador de sincronização parado com sucesso")
@@ -370,8 +516,12 @@ class SyncManager:
 
             if success:
                 # Atualiza metadados
-                await self._update_metadata(file_path)
-                await self._update_metadata(target_path)
+                # hashlib libera o GIL, então os dois hashes rodam em paralelo
+                synced_at = datetime.now()
+                await asyncio.gather(
+                    self._update_metadata(file_path, synced_at),
+                    self._update_metadata(target_path, synced_at),
+                )
 
                 # Registra no controle de versão
                 await self.version_control.commit_changes(file_path.parent, "update")
@@ -381,11 +531,44 @@ class SyncManager:
         except Exception as e:
             logger.exception(f"Erro ao processar alteração em {file_path}: {e}")
 
+    async def _process_events(self) -> None:
+        """Consome a fila de arquivos alterados pelo monitor em lotes.
+
+        Aguarda o primeiro caminho e, em seguida, drena sem bloquear tudo o
+        que já estiver enfileirado, processando cada caminho uma única vez.
+        """
+        while True:
+            batch = [await self.event_queue.get()]
+            while True:
+                try:
+                    batch.append(self.event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._handle_batch(batch)
+            finally:
+                for _ in batch:
+                    self.event_queue.task_done()
+
+    async def _handle_batch(self, batch: list[Path]) -> None:
+        """Processa um lote de caminhos, ignorando repetições."""
+        for file_path in dict.fromkeys(batch):
+            await self.handle_file_change(file_path)
+
     def _should_ignore(self, file_path: Path) -> bool:
         """Verifica se arquivo deve ser ignorado."""
         name = file_path.name
         return any(pattern in name for pattern in self.sync_config.ignore_patterns)
 
+    def _is_watched(self, file_path: Path) -> bool:
+        """Verifica se eventos de um arquivo devem ser processados."""
+        if self._should_ignore(file_path):
+            return False
+        if not self.watched_extensions:
+            return True
+        return file_path.suffix.lower()[1:] in self.watched_extensions
+
     def _find_mapping_for_file(self, file_path: Path) -> Optional[PathMappingConfig]:
         """Encontra mapeamento correspondente para um arquivo."""
         str_path = str(file_path)
@@ -402,14 +585,20 @@ class SyncManager:
         relative_path = source_path.relative_to(mapping.target_path)
         return Path(mapping.source_path) / relative_path
 
-    async def _update_metadata(self, file_path: Path) -> None:
-        """Atualiza metadados de arquivo."""
-        try:
-            async with aiofiles.open(file_path, "rb") as f:
-                content = await f.read()
-                file_hash = hashlib.sha256(content).hexdigest()
+    async def _update_metadata(
+        self,
+        file_path: Path,
+        synced_at: Optional[datetime] = None,
+    ) -> None:
+        """Atualiza metadados de arquivo.
 
+        Args:
+            file_path: Caminho do arquivo
+            synced_at: Momento da sincronização; usa o horário atual se omitido
+        """
+        try:
             stat = await aiofiles.os.stat(file_path)
+            file_hash = await self._get_file_hash(file_path, stat)
 
             self.file_metadata[file_path] = FileMetadata(
                 path=file_path,
@@ -417,13 +606,27 @@ class SyncManager:
                 modified_time=stat.st_mtime,
                 size=stat.st_size,
                 doc_type=self._get_doc_type(file_path),
-                last_sync=datetime.now(),
+                last_sync=synced_at or datetime.now(),
                 status=SyncStatus.COMPLETED,
             )
 
         except Exception as e:
             logger.exception(f"Erro ao atualizar metadados de {file_path}: {e}")
 
+    async def _get_file_hash(self, file_path: Path, stat: os.stat_result) -> str:
+        """Retorna o hash do arquivo, reaproveitando-o se não houve alteração."""
+        cached = self._hash_cache.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            self._hash_cache.move_to_end(file_path)
+            return cached[2]
+
+        file_hash = await asyncio.to_thread(file_signature, file_path)
+        self._hash_cache[file_path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        self._hash_cache.move_to_end(file_path)
+        if len(self._hash_cache) > _HASH_CACHE_SIZE:
+            self._hash_cache.popitem(last=False)
+        return file_hash
+
     def _get_doc_type(self, file_path: Path) -> DocumentType:
         """Determina tipo de documento baseado no caminho."""
         str_path = str(file_path)
@@ -3,47 +3,56 @@
 from datetime import datetime
 from typing import Any, Optional
 
+# Rótulos de status
+_STATUS_MAP = {
+    "completed": "Concluído",
+    "in_progress": "Em Andamento",
+    "pending": "Pendente",
+    "delayed": "Atrasado",
+    "cancelled": "Cancelado",
+    "on_track": "No Prazo",
+    "at_risk": "Em Risco",
+    "blocked": "Bloqueado",
+}
+
 
 def format_status(status: str) -> str:
     """Formata o status para exibição."""
-    status_map = {
-        "completed": "Concluído",
-        "in_progress": "Em Andamento",
-        "pending": "Pendente",
-        "delayed": "Atrasado",
-        "cancelled": "Cancelado",
-        "on_track": "No Prazo",
-        "at_risk": "Em Risco",
-        "blocked": "Bloqueado",
-    }
-    return status_map.get(status.lower(), status)
+    return _STATUS_MAP.get(status.lower(), status)
+
+
+# Classes CSS por status
+_STATUS_CLASS_MAP = {
+    "completed": "bg-success",
+    "in_progress": "bg-primary",
+    "pending": "bg-warning",
+    "delayed": "bg-danger",
+    "cancelled": "bg-secondary",
+    "on_track": "bg-success",
+    "at_risk": "bg-warning",
+    "blocked": "bg-danger",
+}
 
 
 def status_class(status: str) -> str:
     """Retorna a classe CSS apropriada para o status."""
-    class_map = {
-        "completed": "bg-success",
-        "in_progress": "bg-primary",
-        "pending": "bg-warning",
-        "delayed": "bg-danger",
-        "cancelled": "bg-secondary",
-        "on_track": "bg-success",
-        "at_risk": "bg-warning",
-        "blocked": "bg-danger",
-    }
-    return class_map.get(status.lower(), "bg-secondary")
+    return _STATUS_CLASS_MAP.get(status.lower(), "bg-secondary")
+
+
+# Formatadores por tipo de métrica
+_METRIC_FORMATTERS = {
+    "percentage": lambda value: f"{float(value):.1f}%",
+    "currency": lambda value: f"R$ {float(value):,.2f}",
+    "number": lambda value: f"{float(value):,.0f}",
+    "decimal": lambda value: f"{float(value):,.2f}",
+}
 
 
 def format_metric(value: Any, metric_type: str, unit: Optional[str] = None) -> str:
     """Formata valor de métrica com base no tipo e unidade."""
-    if metric_type == "percentage":
-        return f"{float(value):.1f}%"
-    if metric_type == "currency":
-        return f"R$ {float(value):,.2f}"
-    if metric_type == "number":
-        return f"{float(value):,.0f}"
-    if metric_type == "decimal":
-        return f"{float(value):,.2f}"
+    formatter = _METRIC_FORMATTERS.get(metric_type)
+    if formatter is not None:
+        return formatter(value)
 
     formatted = str(value)
     if unit:
@@ -69,33 +78,38 @@ def format_version(version: str) -> str:
     return str(version)
 
 
+# Ícones de tendência
+_TREND_MAP = {
+    "up": '<i class="fas fa-arrow-up text-success"></i>',
+    "down": '<i class="fas fa-arrow-down text-danger"></i>',
+    "stable": '<i class="fas fa-equals text-warning"></i>',
+    "increasing": '<i class="fas fa-arrow-up text-success"></i>',
+    "decreasing": '<i class="fas fa-arrow-down text-danger"></i>',
+    "neutral": '<i class="fas fa-equals text-warning"></i>',
+}
+
+
 def format_trend(trend: str, previous_value: Optional[float] = None) -> str:
     """Formata indicador de tendência."""
-    trend_map = {
-        "up": '<i class="fas fa-arrow-up text-success"></i>',
-        "down": '<i class="fas fa-arrow-down text-danger"></i>',
-        "stable": '<i class="fas fa-equals text-warning"></i>',
-        "increasing": '<i class="fas fa-arrow-up text-success"></i>',
-        "decreasing": '<i class="fas fa-arrow-down text-danger"></i>',
-        "neutral": '<i class="fas fa-equals text-warning"></i>',
-    }
-
     if previous_value is not None and isinstance(previous_value, (int, float)):
-        return trend_map.get(trend.lower(), trend)
+        return _TREND_MAP.get(trend.lower(), trend)
     return ""
 
 
+# Classes CSS por prioridade
+_PRIORITY_CLASS_MAP = {
+    "high": "priority-high",
+    "medium": "priority-medium",
+    "low": "priority-low",
+    "alta": "priority-high",
+    "média": "priority-medium",
+    "baixa": "priority-low",
+}
+
+
 def priority_class(priority: str) -> str:
     """Retorna classe CSS para prioridade."""
-    class_map = {
-        "high": "priority-high",
-        "medium": "priority-medium",
-        "low": "priority-low",
-        "alta": "priority-high",
-        "média": "priority-medium",
-        "baixa": "priority-low",
-    }
-    return class_map.get(priority.lower(), "priority-medium")
+    return _PRIORITY_CLASS_MAP.get(priority.lower(), "priority-medium")
 
 
 # Registra todos os filtros disponíveis
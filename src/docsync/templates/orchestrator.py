@@ -6,26 +6,106 @@ Este módulo fornece a infraestrutura para:
 - Formatação consistente
 - Validação de dados
 - Geração multi-formato
+
+Por padrão as seções de um relatório são renderizadas juntas, em um único
+layout. Com ``DOCSYNC_RENDER_PROCS`` igual a ``1``, ``true`` ou ``yes``, cada
+seção é renderizada em um processo separado; vale a pena apenas para seções
+pesadas, já que contexto e resultado atravessam processos.
 """
 
+import contextlib
+import copy
 import logging
+import multiprocessing
+import os
+import pickle
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
-import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from rich.console import Console
-from rich.progress import Progress
+from jinja2 import Template
 
+from docsync.core.base import get_environment, open_report
 from docsync.exceptions import OrchestratorError
-from docsync.utils.filters import FILTERS
+from docsync.utils.config import load_yaml_cached
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
-# Console para feedback visual
-console = Console()
 logger = logging.getLogger(__name__)
 
 
+# Valores de DOCSYNC_RENDER_PROCS que ativam a renderização em processos
+_RENDER_PROCS_ENABLED = frozenset({"1", "true", "yes"})
+
+
+def _render_section(template_dir: str, template_name: str, payload: bytes) -> str:
+    """Renderiza uma seção em um processo de trabalho.
+
+    Usa o ambiente compartilhado do processo, criado na primeira chamada sem
+    pré-compilação: cada processo compila apenas as seções que renderiza.
+    ``payload`` é o contexto já serializado pelo processo principal.
+    """
+    env = get_environment(template_dir)
+    return env.get_template(template_name).render(pickle.loads(payload))
+
+
+def _render_procs_enabled() -> bool:
+    """Indica se DOCSYNC_RENDER_PROCS pede renderização em processos."""
+    value = os.environ.get("DOCSYNC_RENDER_PROCS", "")
+    return value.strip().lower() in _RENDER_PROCS_ENABLED
+
+
+class _NullProgress:
+    """Substitui a barra de progresso quando a saída não é um terminal."""
+
+    def add_task(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+def _progress() -> contextlib.AbstractContextManager:
+    """Cria a barra de progresso, ou um substituto sem custo fora de um TTY."""
+    if sys.stdout.isatty():
+        from rich.progress import Progress
+
+        return Progress()
+    return contextlib.nullcontext(_NullProgress())
+
+
+def _mtime_ns(directory: Path) -> int:
+    """Retorna o mtime de um diretório, ou -1 se ele não existir."""
+    try:
+        return directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+def _scan_templates(directory: Path) -> list[str]:
+    """Lista os nomes dos templates Markdown de um diretório.
+
+    Args:
+        directory: Diretório de seções ou layouts
+
+    Returns:
+        list[str]: Nomes dos templates, sem extensão; vazio se o diretório
+        não existir
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.name.split(".", 1)[0]
+                for entry in entries
+                if entry.name.endswith(".md.jinja")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+
+
 @dataclass
 class TemplateConfig:
     """Configuração para renderização de template."""
@@ -63,17 +143,17 @@ class TemplateOrchestrator:
         self.template_dir = Path(template_dir)
         self.config_path = Path(config_path) if config_path else None
 
-        # Configura ambiente Jinja2
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        # Ambiente Jinja2 compartilhado entre instâncias
+        self.env = get_environment(self.template_dir, preload=True)
+
+        # Templates de seção já carregados, por (seção, formato)
+        self._tpl_cache: dict[tuple[str, str], Template] = {}
 
-        # Registra filtros customizados
-        for name, filter_func in FILTERS.items():
-            self.env.filters[name] = filter_func
+        # Layouts que combinam seções, por (seções, formato)
+        self._layout_cache: dict[tuple[tuple[str, ...], str], Template] = {}
+
+        # Última listagem de templates, com os mtimes dos diretórios lidos
+        self._list_cache: Optional[tuple[tuple[int, ...], dict[str, list[str]]]] = None
 
         # Carrega configuração se disponível
         self.config = self._load_config()
@@ -86,8 +166,13 @@ class TemplateOrchestrator:
             return {}
 
         try:
-            with open(self.config_path) as f:
-                return yaml.safe_load(f)
+            # Cópia: o objeto em cache é compartilhado entre instâncias
+            return copy.deepcopy(
+                load_yaml_cached(
+                    str(self.config_path),
+                    self.config_path.stat().st_mtime_ns,
+                ),
+            )
         except Exception as e:
             logger.warning(f"Erro ao carregar configuração: {e}")
             return {}
@@ -118,29 +203,144 @@ class TemplateOrchestrator:
         if errors:
             raise OrchestratorError("\n".join(errors))
 
+    def _load_section_template(self, section: str, format: str) -> Template:
+        """Carrega o template de uma seção, reutilizando o já carregado.
+
+        Args:
+            section: Nome da seção
+            format: Formato do template (md ou html)
+
+        Returns:
+            Template: Template compilado da seção
+        """
+        key = (section, format)
+        template = self._tpl_cache.get(key)
+        if template is None:
+            template_path = f"guardrive/sections/{section}.{format}.jinja"
+            template = self.env.get_template(template_path)
+            self._tpl_cache[key] = template
+        return template
+
     def list_templates(self) -> dict[str, list[str]]:
-        """Lista templates disponíveis."""
-        templates = {"sections": [], "layouts": []}
+        """Lista templates disponíveis.
 
+        A listagem é reaproveitada enquanto o mtime dos diretórios de seções
+        e layouts não mudar.
+        """
+        directories = (
+            self.template_dir / "guardrive/sections",
+            self.template_dir / "guardrive/layouts",
+        )
         try:
-            # Lista seções disponíveis
-            sections_path = self.template_dir / "guardrive/sections"
-            if sections_path.exists():
-                templates["sections"] = [
-                    p.stem.split(".")[0] for p in sections_path.glob("*.md.jinja")
-                ]
-
-            # Lista layouts disponíveis
-            layouts_path = self.template_dir / "guardrive/layouts"
-            if layouts_path.exists():
-                templates["layouts"] = [
-                    p.stem.split(".")[0] for p in layouts_path.glob("*.md.jinja")
-                ]
+            mtimes = tuple(_mtime_ns(directory) for directory in directories)
+            if self._list_cache is None or self._list_cache[0] != mtimes:
+                self._list_cache = (
+                    mtimes,
+                    {
+                        "sections": _scan_templates(directories[0]),
+                        "layouts": _scan_templates(directories[1]),
+                    },
+                )
         except Exception as e:
             logger.exception(f"Erro ao listar templates: {e}")
             raise
 
-        return templates
+        return {kind: list(names) for kind, names in self._list_cache[1].items()}
+
+    def _load_layout(self, sections: list[str], format: str) -> Template:
+        """Monta um template único que inclui as seções em sequência.
+
+        Renderizar o layout equivale a renderizar cada seção e juntar os
+        resultados com uma linha em branco, mas em uma única chamada ao
+        Jinja. O layout compilado é reaproveitado para a mesma lista de
+        seções.
+
+        Args:
+            sections: Nomes das seções, na ordem do relatório
+            format: Formato dos templates (md ou html)
+
+        Returns:
+            Template: Layout compilado
+
+        Raises:
+            TemplateNotFound: Se alguma seção não existir
+        """
+        key = (tuple(sections), format)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            includes = [
+                "{%% include %r %%}" % self._load_section_template(section, format).name
+                for section in sections
+            ]
+            # trim_blocks remove a quebra de linha logo após cada include
+            layout = self.env.from_string("\n\n\n".join(includes))
+            self._layout_cache[key] = layout
+        return layout
+
+    def _render_sections(
+        self,
+        config: TemplateConfig,
+        context: dict[str, Any],
+        progress: "Progress",
+        task: Any,
+    ) -> Optional[list[str]]:
+        """Renderiza as seções do relatório em um pool de processos.
+
+        Os processos são iniciados com ``spawn`` para não herdar threads do
+        processo principal (watchdog, executores). O
+        progresso é atualizado no processo principal, à medida que cada seção
+        termina. Se o contexto não puder ser serializado ou o pool falhar,
+        retorna ``None`` para que o relatório seja gerado no layout único.
+
+        Args:
+            config: Configuração do relatório
+            context: Variáveis dos templates (dados e metadados)
+            progress: Barra de progresso
+            task: Tarefa da barra de progresso
+
+        Returns:
+            Optional[list[str]]: Conteúdo de cada seção, na ordem de
+            config.sections, ou ``None`` se os processos não puderem ser usados
+        """
+        templates = [
+            self._load_section_template(section, config.format)
+            for section in config.sections
+        ]
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from concurrent.futures.process import BrokenProcessPool
+
+        # Serializado uma vez: falha aqui antes de iniciar qualquer processo
+        try:
+            payload = pickle.dumps(context)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Contexto não serializável, usando layout único: {e}")
+            return None
+
+        workers = min(len(templates), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _render_section,
+                        str(self.template_dir),
+                        template.name,
+                        payload,
+                    )
+                    for template in templates
+                ]
+
+                for _ in as_completed(futures):
+                    progress.update(task, advance=1)
+
+                return [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            logger.warning(f"Pool de renderização falhou, usando layout único: {e}")
+            progress.update(task, completed=0)
+            return None
 
     def generate_report(self, config: TemplateConfig) -> Path:
         """Gera relatório combinando seções de template."""
@@ -148,33 +348,45 @@ class TemplateOrchestrator:
             # Valida configuração
             self._validate_template_config(config)
 
-            with Progress() as progress:
+            with _progress() as progress:
                 task = progress.add_task(
                     "Gerando relatório...",
                     total=len(config.sections),
                 )
 
-                content_parts = []
-                for section in config.sections:
-                    template_path = (
-                        f"guardrive/sections/{section}.{config.format}.jinja"
+                # Contexto montado uma vez e passado sem desempacotar
+                context = {**config.data, "metadata": config.metadata}
+
+                content_parts = None
+                if _render_procs_enabled() and len(config.sections) > 1:
+                    # Seções em paralelo, gravadas depois
+                    content_parts = self._render_sections(
+                        config,
+                        context,
+                        progress,
+                        task,
                     )
-                    template = self.env.get_template(template_path)
 
-                    # Renderiza seção
-                    content = template.render(**config.data, metadata=config.metadata)
-                    content_parts.append(content)
-
-                    progress.update(task, advance=1)
-
-                # Combina conteúdo
-                final_content = "\n\n".join(content_parts)
+                layout = None
+                if content_parts is None:
+                    # Todas as seções em uma única renderização
+                    layout = self._load_layout(config.sections, config.format)
 
                 # Garante que diretório de saída existe
                 config.output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Salva arquivo
-                config.output_path.write_text(final_content, encoding="utf-8")
+                # Grava o relatório em blocos, sem montar o documento inteiro;
+                # o relatório anterior só é substituído se a renderização terminar
+                with open_report(config.output_path) as f:
+                    if layout is None:
+                        f.write(content_parts[0])
+                        for part in content_parts[1:]:
+                            f.write("\n\n")
+                            f.write(part)
+                    else:
+                        layout.stream(context).dump(f)
+                        progress.update(task, advance=len(config.sections))
+
                 logger.info(f"Relatório gerado: {config.output_path}")
 
                 return config.output_path
@@ -2,7 +2,7 @@
 and registry functionality.
 """
 
-from .common import setup_logger
+from .common import file_signature, hash_file, setup_logger
 from .config import load_config
 from .filter_registry import (
     FilterRegistry,
@@ -26,6 +26,7 @@ __all__ = [
     "FILTERS",
     "FilterRegistry",
     "ReportRenderer",
+    "file_signature",
     "format_date",
     "format_esg_metric",
     "format_metric",
@@ -34,6 +35,7 @@ __all__ = [
     "format_trend",
     "format_version",
     "get_registered_filters",
+    "hash_file",
     "load_config",
     "register_filter",
     "setup_logger",
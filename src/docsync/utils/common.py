@@ -1,5 +1,6 @@
 """Utilitários para validação, manipulação de arquivos e processamento de templates."""
 
+import hashlib
 import json
 import logging
 import os
@@ -11,6 +12,11 @@ from typing import Optional
 
 import yaml
 
+try:
+    from blake3 import blake3
+except ImportError:  # blake3 é opcional
+    blake3 = None
+
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
@@ -246,6 +252,59 @@ def find_files(
     return sorted(set(found_files))
 
 
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    """Calcula o hash de um arquivo lendo-o em blocos.
+
+    Usa ``hashlib.file_digest`` (Python 3.11+) e, em versões anteriores,
+    um laço de leituras de 1 MiB, sem carregar o arquivo inteiro em memória.
+    ``algorithm="blake3"`` usa o pacote opcional ``blake3``.
+
+    Args:
+        path: Caminho do arquivo
+        algorithm: Nome do algoritmo aceito por ``hashlib.new`` ou ``"blake3"``
+
+    Returns:
+        Hash hexadecimal do conteúdo
+
+    Raises:
+        ValueError: Se ``blake3`` for pedido sem o pacote instalado
+    """
+    if algorithm == "blake3":
+        if blake3 is None:
+            msg = "blake3 não está instalado. Instale com: pip install blake3"
+            raise ValueError(msg)
+        digest = blake3(max_threads=blake3.AUTO)
+    else:
+        digest = None
+
+    with open(path, "rb") as f:
+        if digest is None:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            digest = hashlib.new(algorithm)
+
+        while buf := f.read(1 << 20):
+            digest.update(buf)
+        return digest.hexdigest()
+
+
+def file_signature(path: Path) -> str:
+    """Retorna uma assinatura de conteúdo para comparação interna.
+
+    Usa BLAKE3 quando disponível, com prefixo ``b3:`` para distinguir das
+    assinaturas SHA-256 geradas sem o pacote.
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        Assinatura do conteúdo
+    """
+    if blake3 is not None:
+        return "b3:" + hash_file(path, "blake3")
+    return hash_file(path)
+
+
 def load_metadata(path: Path) -> dict:
     """Carrega metadados de um arquivo YAML ou JSON.
 
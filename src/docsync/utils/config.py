@@ -1,14 +1,38 @@
 """Utilitários para gerenciamento de configuração."""
 
+import functools
 import logging
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML compilado sem libyaml
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=128)
+def load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    """Carrega um arquivo YAML, reaproveitado enquanto o mtime não mudar.
+
+    O objeto retornado é compartilhado entre chamadas e não deve ser alterado;
+    quem o expõe deve entregar uma cópia.
+
+    Args:
+        path: Caminho do arquivo
+        mtime_ns: mtime do arquivo, usado apenas como parte da chave do cache
+
+    Returns:
+        Any: Conteúdo do arquivo
+    """
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 def load_config(config_path: Union[str, Path]) -> dict:
     """Carrega configuração de arquivo YAML.
 
@@ -32,7 +56,7 @@ def load_config(config_path: Union[str, Path]) -> dict:
 
     try:
         with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
             logger.debug("Configuração carregada: %s", config_path)
             return config
     except yaml.YAMLError as e:
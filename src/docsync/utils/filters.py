@@ -1,9 +1,22 @@
 """Custom Jinja2 filters for template rendering."""
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 
+# Formatadores por tipo de métrica
+_METRIC_FORMATTERS = {
+    "percentage": lambda value: f"{float(value):.1f}%",
+    "currency": lambda value: f"R$ {float(value):,.2f}",
+    "number": lambda value: f"{float(value):,.2f}",
+}
+
+# Tipos de métrica que já trazem a unidade no próprio formato
+_METRIC_TYPES_WITHOUT_UNIT = frozenset({"percentage", "currency"})
+
+
 def format_metric(value: Any, metric_type: str, unit: Optional[str] = None) -> str:
     """Format a metric value based on its type and unit.
 
@@ -18,23 +31,16 @@ def format_metric(value: Any, metric_type: str, unit: Optional[str] = None) -> s
     if not value:
         return "N/A"
 
+    formatter = _METRIC_FORMATTERS.get(metric_type, str)
     try:
-        if metric_type == "percentage":
-            formatted = f"{float(value):.1f}%"
-        elif metric_type == "currency":
-            formatted = f"R$ {float(value):,.2f}"
-        elif metric_type == "number":
-            formatted = f"{float(value):,.2f}"
-        else:
-            formatted = str(value)
-
-        if unit and metric_type not in ("percentage", "currency"):
-            formatted = f"{formatted} {unit}"
-
-        return formatted
+        formatted = formatter(value)
     except (ValueError, TypeError):
         return str(value)
 
+    if unit and metric_type not in _METRIC_TYPES_WITHOUT_UNIT:
+        formatted = f"{formatted} {unit}"
+    return formatted
+
 
 def to_percentage(value: float) -> str:
     """Convert decimal to percentage string."""
@@ -44,41 +50,72 @@ def to_percentage(value: float) -> str:
         return "0.0%"
 
 
+# Datas aceitas por format_date: AAAA-MM-DD (com hora opcional) ou DD/MM/AAAA
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?"
+    r"|(\d{1,2})/(\d{1,2})/(\d{4})",
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_date_str(value: str, format_str: str) -> str:
+    """Parse and reformat a date string with a single regex match."""
+    match = _DATE_RE.fullmatch(value)
+    if match is None:
+        return value
+
+    year, month, day, hour, minute, second, dmy_day, dmy_month, dmy_year = (
+        match.groups()
+    )
+    if year is None:
+        year, month, day = dmy_year, dmy_month, dmy_day
+
+    try:
+        parsed = datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+        )
+    except ValueError:
+        return value
+
+    if format_str == "%d/%m/%Y":
+        return f"{parsed.day:02d}/{parsed.month:02d}/{parsed.year}"
+    return parsed.strftime(format_str)
+
+
 def format_date(value: Union[str, datetime], format_str: str = "%d/%m/%Y") -> str:
     """Format date string to dd/mm/yyyy."""
     if not value:
         return ""
 
     if isinstance(value, str):
-        try:
-            # Try different formats
-            for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S"]:
-                try:
-                    date_obj = datetime.strptime(value, fmt)
-                    return date_obj.strftime(format_str)
-                except ValueError:
-                    continue
-        except Exception:
-            return value
-    elif isinstance(value, datetime):
+        return _format_date_str(value, format_str)
+    if isinstance(value, datetime):
         return value.strftime(format_str)
 
     return str(value)
 
 
+# Rótulos de status com emoji
+_STATUS_MAP = {
+    "on_track": "✅ No prazo",
+    "at_risk": "⚠️ Em risco",
+    "delayed": "❌ Atrasado",
+    "completed": "✨ Concluído",
+    "in_progress": "🔄 Em andamento",
+    "not_started": "⏳ Não iniciado",
+    "pending": "⏳ Pendente",
+    "cancelled": "⛔ Cancelado",
+}
+
+
 def format_status(value: str) -> str:
     """Format status with emojis."""
-    status_map = {
-        "on_track": "✅ No prazo",
-        "at_risk": "⚠️ Em risco",
-        "delayed": "❌ Atrasado",
-        "completed": "✨ Concluído",
-        "in_progress": "🔄 Em andamento",
-        "not_started": "⏳ Não iniciado",
-        "pending": "⏳ Pendente",
-        "cancelled": "⛔ Cancelado",
-    }
-    return status_map.get(value, value)
+    return _STATUS_MAP.get(value, value)
 
 
 def format_esg_metric(value: float, unit: Optional[str] = None) -> str:
@@ -107,6 +144,7 @@ def format_trend(value: float, previous: float) -> str:
     return "➡️ Estável"
 
 
+@lru_cache(maxsize=1024)
 def format_progress(
     value: int,
     width: int = 50,
@@ -115,11 +153,16 @@ def format_progress(
 ) -> str:
     """Gera barra de progresso ASCII."""
     filled = int(width * value / 100)
-    bar = fill * filled
-    if value < 100:
-        bar += ">"
-    bar += empty * (width - len(bar))
-    return f"[{bar}] {value}%"
+    arrow = ">" if value < 100 else ""
+    used = len(fill) * max(filled, 0) + len(arrow)
+    return f"[{fill * filled}{arrow}{empty * (width - used)}] {value}%"
+
+
+def format_bullets(items: Any, marker: str = "-") -> str:
+    """Junta uma lista em itens de lista Markdown, um por linha."""
+    if not items:
+        return ""
+    return "\n".join([f"{marker} {item}" for item in items])
 
 
 # Registro de filtros
@@ -132,4 +175,5 @@ FILTERS = {
     "format_progress": format_progress,
     "format_metric": format_metric,
     "to_percentage": to_percentage,
+    "format_bullets": format_bullets,
 }
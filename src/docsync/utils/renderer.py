@@ -4,15 +4,6 @@ import logging
 from pathlib import Path
 from typing import Any, Optional, Union
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
-from docsync.utils.filters import (
-    format_date,
-    format_metric,
-    format_status,
-    to_percentage,
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -46,19 +37,10 @@ class ReportRenderer:
         logger.debug("Initializing template renderer at: %s", self.templates_dir)
 
         try:
-            self.env = Environment(
-                loader=FileSystemLoader(str(self.templates_dir), encoding=encoding),
-                autoescape=select_autoescape(["html", "xml"]),
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
-
-            # Register custom filters
-            self.env.filters["format_metric"] = format_metric
-            self.env.filters["to_percentage"] = to_percentage
-            self.env.filters["format_date"] = format_date
-            self.env.filters["format_status"] = format_status
+            # Imported here: docsync.core.base depends on this package
+            from docsync.core.base import get_environment
 
+            self.env = get_environment(self.templates_dir, encoding, preload=True)
             logger.info("Template renderer initialized successfully")
 
         except Exception as e:
@@ -101,7 +83,7 @@ class ReportRenderer:
             template = self.env.get_template(template_name)
 
             # Render template
-            rendered = template.render(**data)
+            rendered = template.render(data)
 
             # Save output if path provided
             if output_path:
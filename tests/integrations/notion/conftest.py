@@ -1,5 +1,4 @@
 # conftest.py
-import asyncio
 from datetime import datetime
 
 import pytest
@@ -10,13 +9,6 @@ from docsync.integrations.notion import (
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def sample_notion_page():
     return NotionPage(
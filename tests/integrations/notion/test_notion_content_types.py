@@ -12,7 +12,7 @@ from docsync.integrations.notion.notion_content_types import (
 
 
 # Fixtures para testes
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_markdown():
     return """# Título Principal
 
@@ -34,28 +34,43 @@ def hello_world():
 """
 
 
-@pytest.fixture
+# Blocos de exemplo, construídos uma única vez na importação do módulo
+_SAMPLE_BLOCKS = (
+    NotionHeading(type="heading", content="Título Principal", level=1),
+    NotionBlock(
+        type="paragraph",
+        content="Este é um parágrafo de exemplo com algumas informações importantes.",
+    ),
+    NotionHeading(type="heading", content="Seção de Código", level=2),
+    NotionCodeBlock(
+        type="code",
+        content='def hello_world():\\n    print("Hello from DOCSYNC!")',
+        language="python",
+    ),
+    NotionHeading(type="heading", content="Subseção", level=3),
+    NotionTable(
+        type="table",
+        content="",
+        headers=["Nome", "Idade", "Profissão"],
+        rows=[["João", "30", "Dev"], ["Maria", "28", "Designer"]],
+    ),
+)
+
+
+@pytest.fixture(scope="session")
 def sample_blocks():
-    return [
-        NotionHeading(type="heading", content="Título Principal", level=1),
-        NotionBlock(
-            type="paragraph",
-            content="Este é um parágrafo de exemplo com algumas informações importantes.",
-        ),
-        NotionHeading(type="heading", content="Seção de Código", level=2),
-        NotionCodeBlock(
-            type="code",
-            content='def hello_world():\\n    print("Hello from DOCSYNC!")',
-            language="python",
-        ),
-        NotionHeading(type="heading", content="Subseção", level=3),
-        NotionTable(
-            type="table",
-            content="",
-            headers=["Nome", "Idade", "Profissão"],
-            rows=[["João", "30", "Dev"], ["Maria", "28", "Designer"]],
-        ),
-    ]
+    return _SAMPLE_BLOCKS
+
+
+@pytest.fixture(scope="session")
+def converter():
+    return NotionContentConverter()
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_blocks(converter, sample_markdown):
+    # Convertido uma única vez; os testes apenas leem os blocos
+    return converter.markdown_to_blocks(sample_markdown)
 
 
 def test_heading_from_markdown():
@@ -123,19 +138,17 @@ def test_table_to_notion():
     assert notion_block["table"]["has_column_header"] is True
 
 
-def test_content_converter_markdown_to_blocks(sample_markdown):
+def test_content_converter_markdown_to_blocks(parsed_sample_blocks):
     """Testa conversão completa de markdown para blocos do Notion"""
-    converter = NotionContentConverter()
-    blocks = converter.markdown_to_blocks(sample_markdown)
+    blocks = parsed_sample_blocks
 
     assert len(blocks) > 0
     assert isinstance(blocks[0], NotionHeading)
     assert blocks[0].level == 1
 
 
-def test_content_converter_blocks_to_notion(sample_blocks):
+def test_content_converter_blocks_to_notion(converter, sample_blocks):
     """Testa conversão de blocos para formato da API do Notion"""
-    converter = NotionContentConverter()
     notion_blocks = converter.blocks_to_notion(sample_blocks)
 
     assert len(notion_blocks) == len(sample_blocks)
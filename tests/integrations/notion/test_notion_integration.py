@@ -1,4 +1,6 @@
 # test_notion_integration.py
+import copy
+import pickle
 from pathlib import Path
 from unittest.mock import patch, AsyncMock
 
@@ -35,6 +37,81 @@ def mock_client():
         yield client
 
 
+# Corpos de resposta da API Notion usados nos testes do cliente
+_RESPONSE_BODIES = {
+    "user": {"id": "user_id"},
+    "page": {
+        "id": "test_id",
+        "object": "page",
+        "created_time": "2025-06-04T12:00:00Z",
+        "last_edited_time": "2025-06-04T12:00:00Z",
+        "parent": {"type": "workspace", "workspace": True},
+        "properties": {"title": {"title": [{"plain_text": "Test Page"}]}},
+    },
+    "database": {
+        "id": "test_db",
+        "object": "database",
+        "created_time": "2025-06-04T12:00:00Z",
+        "last_edited_time": "2025-06-04T12:00:00Z",
+        "title": [{"plain_text": "Test Database"}],
+        "description": [],
+        "properties": {},
+    },
+    "query": {"results": [], "has_more": False},
+}
+
+
+class FakeResponse:
+    """Resposta aiohttp mínima: status, headers, json() e async with."""
+
+    def __init__(self, body: dict, status: int = 200) -> None:
+        self._body = body
+        self.status = status
+        self.headers = {}
+
+    async def json(self) -> dict:
+        return self._body
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *exc_info) -> bool:
+        return False
+
+
+def _mock_response(body: str, status: int = 200) -> FakeResponse:
+    """Cria a resposta HTTP simulada de um corpo conhecido."""
+    return FakeResponse(_RESPONSE_BODIES[body], status)
+
+
+@pytest.fixture(scope="session")
+def make_mock_response():
+    return _mock_response
+
+
+@pytest.fixture
+def mock_session():
+    with patch("docsync.integrations.notion.client.aiohttp.ClientSession") as mock:
+        yield mock
+
+
+@pytest.fixture
+def async_client(notion_config, mock_session):
+    return NotionClient(notion_config)
+
+
+@pytest.fixture
+def respond_with(mock_session, make_mock_response):
+    """Define, em ordem, os corpos das respostas da sessão simulada."""
+
+    def respond(*bodies: str) -> None:
+        mock_session.return_value.request.side_effect = [
+            make_mock_response(body) for body in bodies
+        ]
+
+    return respond
+
+
 @pytest.fixture
 def notion_bridge(notion_config, mock_client):
     return NotionBridge(config=notion_config)
@@ -48,75 +125,42 @@ async def test_notion_bridge_initialization(notion_bridge, mock_client):
 
 
 @pytest.mark.asyncio
-async def test_notion_client_connection(mock_client, notion_config):
-    # O mock_client já está patcheado para retornar o mock
-    # Mas aqui o teste instancia um NOVO NotionClient.
-    # Precisamos garantir que este novo também seja mockado ou usar o mock diretamente.
-    with patch("docsync.integrations.notion.client.aiohttp.ClientSession") as mock_session:
-        client = NotionClient(notion_config)
-        # Mockar a resposta de users/me
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.headers = {}
-        mock_resp.json = AsyncMock(return_value={"id": "user_id"})
-        mock_session.return_value.request.return_value.__aenter__.return_value = mock_resp
-        
-        assert await client.verify_connection() is True
+async def test_verify_connection(async_client, respond_with):
+    respond_with("user")
+
+    assert await async_client.verify_connection() is True
 
 
 @pytest.mark.asyncio
-async def test_notion_page_retrieval(mock_client, notion_config):
-    with patch("docsync.integrations.notion.client.aiohttp.ClientSession") as mock_session:
-        client = NotionClient(notion_config)
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.headers = {}
-        mock_resp.json = AsyncMock(return_value={
-            "id": "test_id",
-            "object": "page",
-            "created_time": "2025-06-04T12:00:00Z",
-            "last_edited_time": "2025-06-04T12:00:00Z",
-            "parent": {"type": "workspace", "workspace": True},
-            "properties": {"title": {"title": [{"plain_text": "Test Page"}]}},
-        })
-        mock_session.return_value.request.return_value.__aenter__.return_value = mock_resp
-
-        page = await client.get_page("test_id")
-        assert page.id == "test_id"
-        assert page.title == "Test Page"
+@pytest.mark.parametrize(
+    ("bodies", "method", "object_id", "title"),
+    [
+        pytest.param(["page"], "get_page", "test_id", "Test Page", id="page"),
+        # get_database, seguido de get_pages_in_database (chamado por
+        # _convert_to_notion_database)
+        pytest.param(
+            ["database", "query"],
+            "get_database",
+            "test_db",
+            "Test Database",
+            id="database",
+        ),
+    ],
+)
+async def test_notion_api_calls(
+    async_client,
+    respond_with,
+    bodies,
+    method,
+    object_id,
+    title,
+):
+    respond_with(*bodies)
 
+    result = await getattr(async_client, method)(object_id)
 
-@pytest.mark.asyncio
-async def test_notion_database_retrieval(mock_client, notion_config):
-    with patch("docsync.integrations.notion.client.aiohttp.ClientSession") as mock_session:
-        client = NotionClient(notion_config)
-        
-        # Mock para get_database
-        mock_db_resp = AsyncMock()
-        mock_db_resp.status = 200
-        mock_db_resp.headers = {}
-        mock_db_resp.json = AsyncMock(return_value={
-            "id": "test_db",
-            "object": "database",
-            "created_time": "2025-06-04T12:00:00Z",
-            "last_edited_time": "2025-06-04T12:00:00Z",
-            "title": [{"plain_text": "Test Database"}],
-            "description": [],
-            "properties": {},
-        })
-        
-        # Mock para get_pages_in_database (chamado por _convert_to_notion_database)
-        mock_query_resp = AsyncMock()
-        mock_query_resp.status = 200
-        mock_query_resp.headers = {}
-        mock_query_resp.json = AsyncMock(return_value={"results": [], "has_more": False})
-        
-        # Configurar retornos sequenciais
-        mock_session.return_value.request.return_value.__aenter__.side_effect = [mock_db_resp, mock_query_resp]
-
-        db = await client.get_database("test_db")
-        assert db.id == "test_db"
-        assert db.title == "Test Database"
+    assert result.id == object_id
+    assert result.title == title
 
 
 @pytest.mark.asyncio
@@ -137,3 +181,32 @@ async def test_sync_mapping(notion_bridge, tmp_path, mock_client):
     await notion_bridge._sync_mapping(mapping)
     # Aqui adicionaremos mais verificações quando implementarmos
     # a lógica completa de sincronização
+
+
+def test_mapping_patterns(tmp_path):
+    """Testa os padrões de arquivo e de exclusão do mapeamento."""
+    mapping = NotionMapping(source_path=tmp_path, target_id="test_target")
+
+    assert mapping.matches("guide.md")
+    assert not mapping.matches("image.png")
+    assert mapping.ignores(".hidden.md")
+    assert mapping.ignores("__pycache__")
+    assert not mapping.ignores("guide.md")
+
+    empty = NotionMapping(
+        source_path=tmp_path,
+        target_id="test_target",
+        file_patterns=[],
+    )
+    assert not empty.matches("guide.md")
+
+
+def test_config_copy_and_pickle(notion_config):
+    """Testa cópia e serialização da configuração com visões somente leitura."""
+    clones = (copy.deepcopy(notion_config), pickle.loads(pickle.dumps(notion_config)))
+    for clone in clones:
+        assert clone == notion_config
+        assert clone.get_headers() == notion_config.get_headers()
+
+    with pytest.raises(TypeError):
+        notion_config.get_timeout()["read"] = 1
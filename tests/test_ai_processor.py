@@ -2,7 +2,9 @@
 Testes unitários para o módulo ai_processor.
 """
 
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import TestCase, main
 
@@ -44,6 +46,17 @@ def test():
         assert result["code_blocks"] == 1
         assert result["metadata"]["title"] == "Test Document"
 
+    def test_headers_inside_code_blocks_ignored(self):
+        """Testa que comentários em blocos de código não viram cabeçalhos."""
+        content = "# Título\n```bash\n# comentário\nls\n```\n## Seção\n```\nsem fim\n"
+        filepath = Path(self.temp_dir) / "fences.md"
+        filepath.write_text(content)
+
+        result = self.processor.process_file(filepath)
+
+        assert [h["text"] for h in result["headers"]] == ["Título", "Seção"]
+        assert result["code_blocks"] == 1
+
     def test_process_yaml(self):
         """Testa processamento de arquivo YAML."""
         content = """
@@ -65,6 +78,28 @@ config:
         assert result["structure"]["type"] == "dict"
         assert "config" in result["structure"]["nested"]
 
+    def test_yaml_results_are_independent(self):
+        """Testa que alterar um resultado não afeta o cache de YAML."""
+        filepath = Path(self.temp_dir) / "shared.yaml"
+        filepath.write_text("config:\n  debug: true\n")
+
+        first = DocProcessor(cache_ttl=0).process_file(filepath)
+        first["content"]["config"]["debug"] = False
+        second = DocProcessor(cache_ttl=0).process_file(filepath)
+
+        assert second["content"]["config"]["debug"] is True
+
+    def test_process_recursive_yaml(self):
+        """Testa que aliases autorreferentes não travam a análise."""
+        filepath = Path(self.temp_dir) / "recursive.yaml"
+        filepath.write_text("a: &x [*x]\n")
+
+        result = self.processor.process_file(filepath)
+
+        node = result["structure"]["nested"]["a"]
+        assert node["type"] == "list"
+        assert node["sample"] == {"type": "alias", "path": "root.a[0]"}
+
     def test_cache_functionality(self):
         """Testa funcionalidade de cache."""
         content = "# Test\nContent"
@@ -83,6 +118,63 @@ config:
         assert final_stats["cache_hits"] == 1
         assert final_stats["processed_files"] == 1
 
+    def test_cache_disabled_without_ttl(self):
+        """Testa que cache_ttl=0 processa o arquivo sem usar o cache."""
+        processor = DocProcessor(cache_ttl=0)
+        filepath = Path(self.temp_dir) / "no_cache.md"
+        filepath.write_text("# Sem cache")
+
+        processor.process_file(filepath)
+        processor.process_file(filepath)
+
+        stats = processor.get_stats()
+        assert stats["processed_files"] == 2
+        assert stats["cache_hits"] == 0
+        assert stats["cache_misses"] == 2
+
+    def test_cache_stats_under_threads(self):
+        """Testa que hits e misses somam as chamadas feitas em várias threads."""
+        paths = []
+        for i in range(4):
+            filepath = Path(self.temp_dir) / f"threaded{i}.md"
+            filepath.write_text(f"# Documento {i}")
+            paths.append(filepath)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.processor.process_file, paths * 40))
+
+        stats = self.processor.get_stats()
+        assert stats["cache_hits"] + stats["cache_misses"] == 160
+        assert stats["cache_misses"] == stats["processed_files"] >= 4
+
+    def test_cache_invalidated_on_change(self):
+        """Testa invalidação do cache quando o arquivo é alterado."""
+        filepath = Path(self.temp_dir) / "changed.md"
+        filepath.write_text("# Primeira versão")
+        first = self.processor.process_file(filepath)
+
+        filepath.write_text("# Segunda versão\n## Nova seção")
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = self.processor.process_file(filepath)
+
+        assert len(first["headers"]) == 1
+        assert len(second["headers"]) == 2
+        assert self.processor.get_stats()["cache_misses"] == 2
+
+    def test_process_directory(self):
+        """Testa processamento de todos os documentos de um diretório."""
+        for i in range(40):
+            (Path(self.temp_dir) / f"doc{i}.md").write_text(f"# Documento {i}")
+
+        results = self.processor.process_directory(Path(self.temp_dir))
+
+        assert len(results) == 40
+        assert all(r["type"] == "markdown" for r in results.values())
+        stats = self.processor.get_stats()
+        assert stats["processed_files"] == 40
+        assert stats["cache_misses"] == 40
+        assert stats["errors"] == 0
 
 class TestAIEnhancedMonitor(TestCase):
     """Testes para a classe AIEnhancedMonitor."""
@@ -2,6 +2,7 @@
 Testes unitários para funcionalidade de geração de relatórios ESG.
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -202,6 +203,127 @@ def test_path_resolution():
     assert "guardrive" in [p.name for p in templates_path.iterdir()]
 
 
+def test_environment_shared_between_instances(tmp_path):
+    """Testa reaproveitamento do ambiente Jinja2 por diretório de templates."""
+    templates_path = Path(__file__).parent.parent / "src" / "docsync" / "templates"
+
+    first = DocumentSynchronizer(base_path=tmp_path, templates_path=templates_path)
+    second = DocumentSynchronizer(base_path=tmp_path, templates_path=templates_path)
+
+    assert first._env is second._env
+
+    template = first._env.get_template("guardrive/esg_report.md.jinja")
+    assert second._env.get_template("guardrive/esg_report.md.jinja") is template
+
+
+def test_get_synchronizer_is_memoized(tmp_path):
+    """Testa reaproveitamento do DocumentSynchronizer por caminhos."""
+    from docsync import get_synchronizer
+
+    first = get_synchronizer(str(tmp_path))
+    assert get_synchronizer(str(tmp_path)) is first
+    assert get_synchronizer(str(tmp_path / "other")) is not first
+
+
+def test_render_returns_report_text(tmp_path):
+    """Testa renderização de relatório sem gravação em disco."""
+    templates_path = Path(__file__).parent.parent / "src" / "docsync" / "templates"
+    doc_sync = DocumentSynchronizer(base_path=tmp_path, templates_path=templates_path)
+
+    content = doc_sync.render(
+        "guardrive/esg_report",
+        {"title": "Relatório ESG Teste", "analysis": {}},
+    )
+
+    assert content.startswith("# Relatório ESG Teste")
+    assert not list(tmp_path.iterdir())
+
+
+def test_failed_render_keeps_existing_report(tmp_path):
+    """Testa que uma falha de renderização não sobrescreve o relatório anterior."""
+    from docsync.exceptions import ReportGenerationError
+
+    templates_path = tmp_path / "templates"
+    templates_path.mkdir()
+    (templates_path / "broken.md.jinja").write_text(
+        "{{ report.title }}\n{{ report.missing.value }}",
+    )
+    doc_sync = DocumentSynchronizer(base_path=tmp_path, templates_path=templates_path)
+    output_path = tmp_path / "out" / "report.md"
+    output_path.parent.mkdir()
+    output_path.write_text("relatório anterior")
+
+    with pytest.raises(ReportGenerationError):
+        doc_sync.generate_report("broken", output_path, {"title": "Novo"})
+
+    assert output_path.read_text() == "relatório anterior"
+    assert list(output_path.parent.iterdir()) == [output_path]
+
+
+def test_bytecode_cache_keyed_by_source(tmp_path):
+    """Testa chave do cache de bytecode por conteúdo, nome e ambiente."""
+    from jinja2 import Environment
+
+    from docsync.core.base import DocSyncBytecodeCache
+
+    cache = DocSyncBytecodeCache(tmp_path)
+    env = Environment()
+    source = "{{ report.title }}"
+
+    first = cache.get_bucket(env, "a.md.jinja", None, source)
+    again = cache.get_bucket(env, "a.md.jinja", None, source)
+    renamed = cache.get_bucket(env, "b.md.jinja", None, source)
+    other = cache.get_bucket(env, "a.md.jinja", None, "{{ report.period }}")
+    trimmed_env = Environment(trim_blocks=True)
+    trimmed = cache.get_bucket(trimmed_env, "a.md.jinja", None, source)
+    escaped_env = Environment(autoescape=True)
+    escaped = cache.get_bucket(escaped_env, "a.md.jinja", None, source)
+
+    filtered_env = Environment()
+    filtered_env.filters["shout"] = str.upper
+    filtered = cache.get_bucket(filtered_env, "a.md.jinja", None, source)
+
+    assert first.key == again.key
+    keys = [first.key, renamed.key, other.key, trimmed.key, escaped.key, filtered.key]
+    assert len(set(keys)) == len(keys)
+
+
+def test_compiled_templates_roundtrip(tmp_path):
+    """Testa carregamento dos templates pré-compilados."""
+    from jinja2 import ModuleLoader
+
+    from docsync.core.base import _create_environment, compile_templates
+
+    target = compile_templates(target=tmp_path / "templates_compiled.zip")
+    env = _create_environment(ModuleLoader(str(target)))
+
+    content = env.get_template("guardrive/esg_report.md.jinja").render(
+        report={"title": "Relatório ESG Compilado", "analysis": {}},
+    )
+
+    assert content.startswith("# Relatório ESG Compilado")
+
+
+def test_stale_compiled_templates_ignored(tmp_path):
+    """Testa que o arquivo pré-compilado é ignorado após editar um template."""
+    from docsync.core.base import _compiled_templates_current, compile_templates
+
+    templates_path = tmp_path / "templates"
+    templates_path.mkdir()
+    template = templates_path / "report.md.jinja"
+    template.write_text("{{ report.title }}")
+    archive = compile_templates(templates_path, tmp_path / "templates_compiled.zip")
+
+    assert _compiled_templates_current(archive, templates_path)
+
+    template.write_text("# {{ report.title }}")
+    built = archive.stat().st_mtime_ns
+    os.utime(template, ns=(built + 10**9, built + 10**9))
+
+    assert not _compiled_templates_current(archive, templates_path)
+    assert not _compiled_templates_current(tmp_path / "missing.zip", templates_path)
+
+
 @pytest.mark.integration
 def test_full_report_generation():
     """Teste de integração para geração completa do relatório."""
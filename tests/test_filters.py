@@ -183,3 +183,30 @@ def test_filter_context():
 
     # Testa renderização
     assert "1,234.56 ton" in template.render(value=1234.56)
+
+
+def test_format_bullets():
+    """Testa junção de listas em itens Markdown."""
+    from docsync.utils.filters import FILTERS
+
+    env = Environment()
+    env.filters.update(FILTERS)
+
+    template = env.from_string("{{ items | format_bullets }}")
+    assert template.render(items=["a", "b"]) == "- a\n- b"
+    assert template.render(items=[]) == ""
+    assert template.render() == ""
+
+    numbered = env.from_string('{{ items | format_bullets("1.") }}')
+    assert numbered.render(items=["a"]) == "1. a"
+
+
+def test_filters_format_date_strings():
+    """Testa formatação de datas em texto nos formatos aceitos."""
+    from docsync.utils.filters import format_date
+
+    assert format_date("2024-01-15") == "15/01/2024"
+    assert format_date("15/01/2024") == "15/01/2024"
+    assert format_date("2024-01-15 14:30:00") == "15/01/2024"
+    assert format_date("2024-01-15", "%Y") == "2024"
+    assert format_date("2024-13-01") == "2024-13-01"
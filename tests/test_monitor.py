@@ -1,6 +1,5 @@
 """Tests for the file system monitoring module."""
 
-import tempfile
 from collections.abc import Generator
 from pathlib import Path
 from time import sleep
@@ -11,13 +10,6 @@ from watchdog.observers import Observer
 from docsync.monitor import FileMonitor, MonitorConfig, create_monitor
 
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
 @pytest.fixture
 def monitor(temp_dir: Path) -> Generator[FileMonitor, None, None]:
     """Create a FileMonitor instance for testing."""
@@ -2,9 +2,11 @@
 Testes para o orquestrador de templates.
 """
 
+import os
 from pathlib import Path
 
 import pytest
+from jinja2 import UndefinedError
 
 from docsync.exceptions import OrchestratorError, TemplateError
 from docsync.templates.orchestrator import TemplateConfig, TemplateOrchestrator
@@ -91,7 +93,160 @@ def test_missing_template(orchestrator, tmp_path):
         orchestrator.generate_report(config)
 
 
+def test_failed_render_keeps_existing_report(orchestrator, template_dir, tmp_path):
+    """Testa que uma falha de renderização não sobrescreve o relatório anterior."""
+    sections = template_dir / "guardrive" / "sections"
+    (sections / "broken.md.jinja").write_text("{{ title.missing.value }}")
+    output_path = tmp_path / "report.md"
+    output_path.write_text("relatório anterior")
+
+    config = TemplateConfig(
+        name="test",
+        sections=["test_section", "broken"],
+        format="md",
+        metadata={},
+        data={"title": "Test"},
+        output_path=output_path,
+    )
+
+    with pytest.raises(UndefinedError):
+        orchestrator.generate_report(config)
+
+    assert output_path.read_text() == "relatório anterior"
+    assert not list(tmp_path.glob(".report.md.*"))
+
+
 def test_list_templates(orchestrator, template_dir):
     """Testa listagem de templates disponíveis."""
     templates = orchestrator.list_templates()
     assert "test_section" in templates["sections"]
+
+
+def test_environment_shared_between_instances(orchestrator, template_dir):
+    """Testa reuso do ambiente Jinja2 entre instâncias."""
+    other = TemplateOrchestrator(template_dir)
+    assert other.env is orchestrator.env
+
+
+def test_config_not_shared_between_instances(template_dir, tmp_path):
+    """Testa que alterar a configuração de uma instância não afeta outras."""
+    config_path = tmp_path / "orchestrator.yaml"
+    config_path.write_text("sections:\n  - test_section\n")
+
+    first = TemplateOrchestrator(template_dir, config_path)
+    first.config["sections"].append("other")
+
+    assert TemplateOrchestrator(template_dir, config_path).config == {
+        "sections": ["test_section"],
+    }
+
+
+def test_environment_shared_with_other_components(orchestrator, template_dir):
+    """Testa que renderer e sincronizador usam o mesmo ambiente e filtros."""
+    from docsync.core.base import get_environment
+    from docsync.utils.filters import FILTERS
+    from docsync.utils.renderer import ReportRenderer
+
+    assert ReportRenderer(template_dir).env is orchestrator.env
+    assert get_environment(template_dir) is orchestrator.env
+    assert FILTERS.keys() <= orchestrator.env.filters.keys()
+
+
+def test_sections_preloaded(orchestrator):
+    """Testa pré-compilação das seções na criação do ambiente."""
+    assert len(orchestrator.env.cache) == 2
+
+
+def test_list_templates_refreshed_on_change(orchestrator, template_dir):
+    """Testa atualização da listagem quando o diretório muda."""
+    assert orchestrator.list_templates()["sections"] == ["test_section"]
+
+    sections = template_dir / "guardrive" / "sections"
+    (sections / "other.md.jinja").write_text("{{ title }}")
+    os.utime(sections, ns=(0, sections.stat().st_mtime_ns + 1))
+
+    assert sorted(orchestrator.list_templates()["sections"]) == [
+        "other",
+        "test_section",
+    ]
+
+
+@pytest.mark.parametrize("render_procs", ["", "1"], ids=["fused", "procs"])
+def test_generate_report_multiple_sections(
+    orchestrator,
+    template_dir,
+    tmp_path,
+    monkeypatch,
+    render_procs,
+):
+    """Testa ordem das seções no layout único e na renderização em processos."""
+    monkeypatch.setenv("DOCSYNC_RENDER_PROCS", render_procs)
+    sections = template_dir / "guardrive" / "sections"
+    for i in range(4):
+        (sections / f"part{i}.md.jinja").write_text(f"## {i} {{{{ title }}}}")
+
+    config = TemplateConfig(
+        name="test",
+        sections=["test_section", "part0", "part1", "part2", "part3"],
+        format="md",
+        metadata={},
+        data={"title": "T"},
+        output_path=tmp_path / "report.md",
+    )
+
+    output = orchestrator.generate_report(config)
+    assert output.read_text() == "# T\n\n## 0 T\n\n## 1 T\n\n## 2 T\n\n## 3 T"
+
+
+@pytest.mark.parametrize("value", ["1", "true", "YES"])
+def test_render_procs_matches_fused_output(orchestrator, tmp_path, monkeypatch, value):
+    """Testa que a renderização em processos gera o mesmo relatório."""
+    config = TemplateConfig(
+        name="test",
+        sections=["test_section", "test_section"],
+        format="md",
+        metadata={},
+        data={"title": "T"},
+        output_path=tmp_path / "fused.md",
+    )
+    fused = orchestrator.generate_report(config).read_text()
+
+    monkeypatch.setenv("DOCSYNC_RENDER_PROCS", value)
+    config.output_path = tmp_path / "procs.md"
+    assert orchestrator.generate_report(config).read_text() == fused
+
+
+def test_render_procs_unpicklable_context(orchestrator, tmp_path, monkeypatch):
+    """Testa que um contexto não serializável recai no layout único."""
+    monkeypatch.setenv("DOCSYNC_RENDER_PROCS", "1")
+    config = TemplateConfig(
+        name="test",
+        sections=["test_section", "test_section"],
+        format="md",
+        metadata={"callback": lambda: None},
+        data={"title": "T"},
+        output_path=tmp_path / "report.md",
+    )
+
+    assert orchestrator.generate_report(config).read_text() == "# T\n\n# T"
+
+
+@pytest.mark.parametrize("value", ["0", "false", "no", ""])
+def test_render_procs_disabled_values(orchestrator, tmp_path, monkeypatch, value):
+    """Testa que valores falsos de DOCSYNC_RENDER_PROCS mantêm o layout único."""
+    monkeypatch.setenv("DOCSYNC_RENDER_PROCS", value)
+    monkeypatch.setattr(
+        TemplateOrchestrator,
+        "_render_sections",
+        lambda *args: pytest.fail("seções renderizadas em processos"),
+    )
+    config = TemplateConfig(
+        name="test",
+        sections=["test_section", "test_section"],
+        format="md",
+        metadata={},
+        data={"title": "T"},
+        output_path=tmp_path / "report.md",
+    )
+
+    assert orchestrator.generate_report(config).read_text() == "# T\n\n# T"
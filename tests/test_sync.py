@@ -14,16 +14,27 @@ Author: DocSync Team
 Date: 2025-06-03
 """
 
+import asyncio
 import shutil
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from docsync.config import Config, DocumentType, load_config
+from docsync.config import (
+    Config,
+    DocumentHandlerConfig,
+    DocumentType,
+    GuardriveConfig,
+    SyncConfig,
+    VersionControlConfig,
+    load_config,
+)
 from docsync.sync_manager import (
     DocumentHandler,
+    FileSystemMonitor,
     SyncManager,
     VersionController,
 )
@@ -177,6 +188,155 @@ class TestDocumentHandler:
         assert isinstance(metadata, dict)
 
 
+# Testes de Monitoramento
+@pytest.mark.asyncio
+class TestFileSystemMonitor:
+    """Testes para agrupamento de eventos do monitor."""
+
+    @staticmethod
+    def _event(event_type, src_path, dest_path=""):
+        return SimpleNamespace(
+            event_type=event_type,
+            src_path=src_path,
+            dest_path=dest_path,
+            is_directory=False,
+        )
+
+    async def test_burst_is_coalesced_per_path(self):
+        """Rajadas de eventos no mesmo arquivo geram um único processamento."""
+        manager = SimpleNamespace(
+            watch_paths=set(),
+            event_queue=asyncio.Queue(),
+            _is_watched=lambda path: path.suffix == ".md",
+        )
+        monitor = FileSystemMonitor(manager)
+        monitor.debounce_interval = 0.01
+        monitor.start()
+
+        for event_type in ("created", "modified", "modified"):
+            monitor.on_any_event(self._event(event_type, "/docs/a.md"))
+        monitor.on_any_event(self._event("created", "/docs/tmp.md"))
+        monitor.on_any_event(self._event("deleted", "/docs/tmp.md"))
+        monitor.on_any_event(self._event("modified", "/docs/.a.md.swp"))
+        monitor.on_any_event(self._event("opened", "/docs/b.md"))
+
+        await asyncio.sleep(0.1)
+        monitor.stop()
+
+        assert manager.event_queue.qsize() == 1
+        assert manager.event_queue.get_nowait() == Path("/docs/a.md")
+
+    async def test_move_filters_each_side(self):
+        """Renomeações só registram os lados com caminho monitorado."""
+        manager = SimpleNamespace(
+            watch_paths=set(),
+            event_queue=asyncio.Queue(),
+            _is_watched=lambda path: path.suffix == ".md",
+        )
+        monitor = FileSystemMonitor(manager, loop=asyncio.get_running_loop())
+        monitor.debounce_interval = 0.01
+
+        monitor.on_any_event(self._event("moved", "/docs/a.md", "/docs/a.md.tmp"))
+        monitor.on_any_event(self._event("moved", "/docs/b.tmp", "/docs/b.md"))
+
+        assert monitor._pending == {"/docs/a.md": "deleted", "/docs/b.md": "created"}
+
+        await asyncio.sleep(0.05)
+        assert manager.event_queue.get_nowait() == Path("/docs/b.md")
+        assert manager.event_queue.empty()
+
+    async def test_full_queue_defers_paths(self):
+        """Caminhos que não cabem na fila são reenviados depois."""
+        manager = SimpleNamespace(
+            watch_paths=set(),
+            event_queue=asyncio.Queue(maxsize=1),
+            _is_watched=lambda path: True,
+        )
+        monitor = FileSystemMonitor(manager, loop=asyncio.get_running_loop())
+        monitor.debounce_interval = 0.01
+
+        monitor._pending = {"/docs/a.md": "modified", "/docs/b.md": "modified"}
+        monitor._flush()
+
+        assert manager.event_queue.get_nowait() == Path("/docs/a.md")
+        assert monitor._pending == {"/docs/b.md": "modified"}
+
+        await asyncio.sleep(0.05)
+        assert manager.event_queue.get_nowait() == Path("/docs/b.md")
+
+    async def test_delete_wins_over_modify(self):
+        """Remoção descarta modificações pendentes do mesmo arquivo."""
+        monitor = FileSystemMonitor(SimpleNamespace(watch_paths=set()))
+
+        monitor._coalesce("/docs/a.md", "modified")
+        monitor._coalesce("/docs/a.md", "deleted")
+
+        assert monitor._pending == {"/docs/a.md": "deleted"}
+
+
+# Testes do Gerenciador
+@pytest.fixture
+def watching_config(temp_test_dir):
+    """Configuração com monitoramento em tempo real em um diretório temporário."""
+    guardrive = GuardriveConfig(
+        base_path=str(temp_test_dir),
+        doc_handlers={"default": DocumentHandlerConfig(file_extensions=["md"])},
+        version_control=VersionControlConfig(enabled=False, backup_enabled=False),
+    )
+    for name in (guardrive.docs_path, guardrive.dev_path):
+        (temp_test_dir / name).mkdir()
+
+    return Config(sync=SyncConfig(real_time_sync=True), guardrive=guardrive)
+
+
+@pytest.mark.asyncio
+class TestSyncManager:
+    """Testes do ciclo de vida do gerenciador de sincronização."""
+
+    async def test_start_event_stop(self, watching_config, temp_test_dir):
+        """Arquivos alterados chegam ao handler pela fila de eventos."""
+        manager = SyncManager(watching_config)
+        manager.monitor.debounce_interval = 0.01
+        changed = asyncio.Event()
+
+        async def handle_file_change(file_path):
+            changed.set()
+
+        with patch.object(
+            manager,
+            "handle_file_change",
+            AsyncMock(side_effect=handle_file_change),
+        ) as handler:
+            await manager.start()
+            assert manager._event_worker is not None
+
+            doc = temp_test_dir / "GUARDRIVE_DOCS" / "a.md"
+            doc.write_text("content")
+            await asyncio.wait_for(changed.wait(), timeout=5)
+
+            await manager.stop()
+
+        assert manager._event_worker is None
+        handler.assert_awaited_with(doc)
+
+    async def test_event_worker_deduplicates_batch(self, watching_config):
+        """Caminhos repetidos na fila são processados uma vez por lote."""
+        manager = SyncManager(watching_config)
+        for name in ("a.md", "b.md", "a.md"):
+            manager.event_queue.put_nowait(Path(name))
+
+        with patch.object(manager, "handle_file_change", AsyncMock()) as handler:
+            worker = asyncio.create_task(manager._process_events())
+            await asyncio.wait_for(manager.event_queue.join(), timeout=1)
+            worker.cancel()
+            manager.scheduler.cancel()
+
+        assert [c.args[0] for c in handler.await_args_list] == [
+            Path("a.md"),
+            Path("b.md"),
+        ]
+
+
 # Testes de Controle de Versão
 @pytest.mark.asyncio
 class TestVersionControl: